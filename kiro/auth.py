@@ -28,8 +28,11 @@ Manages the lifecycle of access tokens:
 """
 
 import asyncio
+import errno
 import json
+import os
 import sqlite3
+import time
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from pathlib import Path
@@ -61,6 +64,14 @@ SQLITE_REGISTRATION_KEYS = [
     "codewhisperer:odic:device-registration",
 ]
 
+# Errors where the temp-file-and-rename save cannot work for the credentials file:
+# single-file bind mount (EBUSY), cross-device link (EXDEV), unwritable directory
+# (EACCES) or read-only location (EROFS). The file is then rewritten in place.
+IN_PLACE_SAVE_ERRNOS = frozenset({errno.EBUSY, errno.EXDEV, errno.EACCES, errno.EROFS})
+
+# Mode for a credentials file that does not exist yet
+NEW_CREDS_FILE_MODE = 0o600
+
 
 class AuthType(Enum):
     """
@@ -165,6 +176,7 @@ class KiroAuthManager:
         self._refresh_url = get_kiro_refresh_url(region)
         self._api_host = get_kiro_api_host(region)
         self._q_host = get_kiro_q_host(region)
+        self._generate_url = f"{self._api_host}/generateAssistantResponse"
         
         # Log initialized endpoints for diagnostics (helps with DNS issues like #58)
         logger.info(f"Auth manager initialized: region={region}, api_host={self._api_host}, q_host={self._q_host}")
@@ -347,6 +359,7 @@ class KiroAuthManager:
                 self._refresh_url = get_kiro_refresh_url(self._region)
                 self._api_host = get_kiro_api_host(self._region)
                 self._q_host = get_kiro_q_host(self._region)
+                self._generate_url = f"{self._api_host}/generateAssistantResponse"
                 logger.info(f"Region updated from credentials file: region={self._region}, api_host={self._api_host}, q_host={self._q_host}")
             
             # Load clientIdHash and device registration for Enterprise Kiro IDE
@@ -434,15 +447,61 @@ class KiroAuthManager:
             if self._profile_arn:
                 existing_data['profileArn'] = self._profile_arn
             
-            # Save
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            target = path.resolve()
+            try:
+                self._write_credentials_atomically(target, existing_data)
+            except OSError as e:
+                if e.errno not in IN_PLACE_SAVE_ERRNOS:
+                    raise
+                # Rename is not possible here (bind mount, read-only or unwritable
+                # directory) - fall back to rewriting the existing file in place
+                logger.debug(f"Atomic save not possible for {target} ({e}), rewriting in place")
+                with open(target, 'w', encoding='utf-8') as f:
+                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
             
             logger.debug(f"Credentials saved to {self._creds_file}")
             
         except Exception as e:
             logger.error(f"Error saving credentials: {e}")
     
+    @staticmethod
+    def _write_credentials_atomically(target: Path, data: dict) -> None:
+        """
+        Writes credentials to a temp file next to the target and renames it over.
+        
+        A crash mid-write never leaves a truncated credentials file behind.
+        The temp file is created exclusively with the target's mode (0600 for
+        a new file), so the tokens are never on disk with looser permissions,
+        and it is removed again if any step fails.
+        
+        Args:
+            target: Resolved path of the credentials file
+            data: Credentials data to write
+        
+        Raises:
+            OSError: If the temp file cannot be created, written or renamed
+        """
+        tmp_path = target.with_name(target.name + ".tmp")
+        try:
+            target_mode = target.stat().st_mode & 0o777
+        except FileNotFoundError:
+            target_mode = NEW_CREDS_FILE_MODE
+        
+        # Left over from an interrupted save - O_EXCL would refuse to reuse it
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, target_mode)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                # umask can only have narrowed the mode - restore the target's exact mode
+                os.chmod(tmp_path, target_mode)
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def _save_credentials_to_sqlite(self) -> None:
         """
         Saves updated credentials back to SQLite database.
@@ -532,8 +591,8 @@ class KiroAuthManager:
         if not self._expires_at:
             return True  # If no expiration info available, assume refresh is needed
         
-        now = datetime.now(timezone.utc)
-        threshold = now.timestamp() + TOKEN_REFRESH_THRESHOLD
+        # Compare epoch seconds - called on every request, no need to build datetimes
+        threshold = time.time() + TOKEN_REFRESH_THRESHOLD
         
         return self._expires_at.timestamp() <= threshold
     
@@ -551,8 +610,7 @@ class KiroAuthManager:
         if not self._expires_at:
             return True  # If no expiration info available, assume expired
         
-        now = datetime.now(timezone.utc)
-        return now >= self._expires_at
+        return time.time() >= self._expires_at.timestamp()
     
     async def _refresh_token_request(self) -> None:
         """
@@ -841,6 +899,18 @@ class KiroAuthManager:
         """AWS CodeWhisperer profile ARN."""
         return self._profile_arn
     
+    @property
+    def effective_profile_arn(self) -> str:
+        """
+        Profile ARN to send in Kiro API requests.
+        
+        Only Kiro Desktop auth uses profileArn; AWS SSO OIDC (Builder ID)
+        users get 403 if it is sent, so this is "" for them.
+        """
+        if self._auth_type == AuthType.KIRO_DESKTOP and self._profile_arn:
+            return self._profile_arn
+        return ""
+    
     @property
     def region(self) -> str:
         """AWS region."""
@@ -851,6 +921,11 @@ class KiroAuthManager:
         """API host for the current region."""
         return self._api_host
     
+    @property
+    def generate_url(self) -> str:
+        """generateAssistantResponse endpoint URL for the current region."""
+        return self._generate_url
+    
     @property
     def q_host(self) -> str:
         """Q API host for the current region."""
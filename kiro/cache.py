@@ -61,6 +61,7 @@ class ModelInfoCache:
         self._lock = asyncio.Lock()
         self._last_update: Optional[float] = None
         self._cache_ttl = cache_ttl
+        self._version = 0
     
     async def update(self, models_data: List[Dict[str, Any]]) -> None:
         """
@@ -76,6 +77,7 @@ class ModelInfoCache:
             logger.info(f"Updating model cache. Found {len(models_data)} models.")
             self._cache = {model["modelId"]: model for model in models_data}
             self._last_update = time.time()
+            self._version += 1
     
     def get(self, model_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -124,6 +126,7 @@ class ModelInfoCache:
                 "_internal_id": internal_id,  # Store internal ID for reference
                 "_is_hidden": True,  # Mark as hidden model
             }
+            self._version += 1
             logger.debug(f"Added hidden model: {display_name} → {internal_id}")
     
     def get_max_input_tokens(self, model_id: str) -> int:
@@ -179,4 +182,9 @@ class ModelInfoCache:
     @property
     def last_update_time(self) -> Optional[float]:
         """Last update time (timestamp) or None."""
-        return self._last_update
\ No newline at end of file
+        return self._last_update
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped on every content change, for derived caches."""
+        return self._version
\ No newline at end of file
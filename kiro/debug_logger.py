@@ -75,8 +75,13 @@ class DebugLogger:
         self._app_logs_buffer: io.StringIO = io.StringIO()
         self._loguru_sink_id: Optional[int] = None
     
-    def _is_enabled(self) -> bool:
-        """Checks if logging is enabled."""
+    def is_enabled(self) -> bool:
+        """
+        Checks if logging is enabled.
+        
+        Public so callers can skip building expensive debug data
+        (e.g. pretty-printed payloads) when it would be discarded.
+        """
         return DEBUG_MODE in ("errors", "all")
     
     def _is_immediate_write(self) -> bool:
@@ -134,7 +139,7 @@ class DebugLogger:
         In "errors" mode: clears buffers.
         In both modes: sets up application log capture.
         """
-        if not self._is_enabled():
+        if not self.is_enabled():
             return
         
         # Clear buffers in any case
@@ -160,7 +165,7 @@ class DebugLogger:
         In "all" mode: writes immediately to file.
         In "errors" mode: buffers.
         """
-        if not self._is_enabled():
+        if not self.is_enabled():
             return
 
         if self._is_immediate_write():
@@ -176,7 +181,7 @@ class DebugLogger:
         In "all" mode: writes immediately to file.
         In "errors" mode: buffers.
         """
-        if not self._is_enabled():
+        if not self.is_enabled():
             return
 
         if self._is_immediate_write():
@@ -192,7 +197,7 @@ class DebugLogger:
         In "all" mode: writes immediately to file.
         In "errors" mode: buffers.
         """
-        if not self._is_enabled():
+        if not self.is_enabled():
             return
 
         if self._is_immediate_write():
@@ -208,7 +213,7 @@ class DebugLogger:
         In "all" mode: writes immediately to file.
         In "errors" mode: buffers.
         """
-        if not self._is_enabled():
+        if not self.is_enabled():
             return
 
         if self._is_immediate_write():
@@ -229,7 +234,7 @@ class DebugLogger:
             status_code: HTTP error status code
             error_message: Error message (optional)
         """
-        if not self._is_enabled():
+        if not self.is_enabled():
             return
         
         try:
@@ -259,7 +264,7 @@ class DebugLogger:
             status_code: HTTP error status code
             error_message: Error message (optional)
         """
-        if not self._is_enabled():
+        if not self.is_enabled():
             return
         
         # In "all" mode data is already written, add error_info and app logs
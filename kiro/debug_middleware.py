@@ -37,6 +37,7 @@ Flush/discard operations are handled by:
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
 from loguru import logger
 
 from kiro.config import DEBUG_MODE
@@ -67,6 +68,25 @@ class DebugLoggerMiddleware(BaseHTTPMiddleware):
     - flush_on_error() / discard_buffers(): Called in routes or exception handlers
     """
     
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        ASGI entry point with a pass-through fast path.
+        
+        BaseHTTPMiddleware wraps every request in a task group and pipes
+        streaming responses through a memory stream. Requests that will not
+        be logged (debug mode off, or non-API paths) go straight to the app.
+        
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http" or DEBUG_MODE == "off" or scope["path"] not in LOGGED_ENDPOINTS:
+            await self.app(scope, receive, send)
+            return
+        
+        await super().__call__(scope, receive, send)
+    
     async def dispatch(self, request: Request, call_next) -> Response:
         """
         Process the request and initialize debug logging if needed.
@@ -31,6 +31,7 @@ with connection pooling for better resource management.
 """
 
 import asyncio
+import ssl
 from typing import Optional
 
 import httpx
@@ -43,6 +44,27 @@ from kiro.utils import get_kiro_headers
 from kiro.network_errors import classify_network_error, get_short_error_message, NetworkErrorInfo
 
 
+# TLS context shared by per-request clients. Building one loads the CA bundle
+# (~20 ms of blocking CPU), which would otherwise happen on every streaming request.
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Returns the process-wide TLS context, creating it on first use.
+    
+    Per-request clients still open their own connections (see issue #54);
+    only the certificate/verification setup is shared.
+    
+    Returns:
+        SSL context with httpx default verification (certifi, SSL_CERT_FILE/DIR)
+    """
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = httpx.create_ssl_context()
+    return _ssl_context
+
+
 class KiroHttpClient:
     """
     HTTP client for Kiro API with retry logic support.
@@ -141,7 +163,11 @@ class KiroHttpClient:
                 timeout_config = httpx.Timeout(timeout=300.0)
                 logger.debug("Creating non-streaming HTTP client (timeout=300s)")
             
-            self.client = httpx.AsyncClient(timeout=timeout_config, follow_redirects=True)
+            self.client = httpx.AsyncClient(
+                timeout=timeout_config,
+                follow_redirects=True,
+                verify=get_ssl_context()
+            )
         return self.client
     
     async def close(self) -> None:
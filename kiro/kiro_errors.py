@@ -27,6 +27,7 @@ Architecture:
 - KiroErrorReason: Enum of known error reasons from Kiro API
 - KiroErrorInfo: Structured information about an enhanced error
 - enhance_kiro_error(): Analyzes error JSON and returns enhanced message
+- read_kiro_error_message(): Reads a non-200 Kiro response into a user-facing message
 
 Example:
     >>> error_json = {"message": "Input is too long.", "reason": "CONTENT_LENGTH_EXCEEDS_THRESHOLD"}
@@ -35,12 +36,16 @@ Example:
     "Model context limit reached. Conversation size exceeds model capacity."
 """
 
+import json
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Any
 
+import httpx
 from loguru import logger
 
+from kiro.utils import json_loads
+
 
 @dataclass
 class KiroErrorInfo:
@@ -128,3 +133,37 @@ def enhance_kiro_error(error_json: Dict[str, Any]) -> KiroErrorInfo:
         user_message=user_message,
         original_message=original_message
     )
+
+
+async def read_kiro_error_message(response: httpx.Response) -> str:
+    """
+    Reads the body of a failed Kiro API response and builds the client-facing message.
+    
+    Shared by the OpenAI and Anthropic routes, which only differ in how the
+    message is wrapped. If the body is a Kiro error JSON, the message is
+    enhanced via enhance_kiro_error(); otherwise the raw body text is returned.
+    
+    Args:
+        response: Kiro API response with a non-200 status code
+    
+    Returns:
+        Error message to return to the client
+    """
+    try:
+        error_content = await response.aread()
+    except Exception:
+        error_content = b"Unknown error"
+    
+    error_text = error_content.decode('utf-8', errors='replace')
+    
+    # Try to parse JSON response from Kiro to extract error message
+    try:
+        error_json = json_loads(error_text)
+        # Enhance Kiro API errors with user-friendly messages
+        error_info = enhance_kiro_error(error_json)
+    except (json.JSONDecodeError, KeyError):
+        return error_text
+    
+    # Log original error for debugging
+    logger.debug(f"Original Kiro error: {error_info.original_message} (reason: {error_info.reason})")
+    return error_info.user_message
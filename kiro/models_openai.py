@@ -30,6 +30,17 @@ from typing_extensions import Annotated
 from pydantic import BaseModel, Field
 
 
+def _unix_timestamp() -> int:
+    """
+    Returns current Unix time in whole seconds.
+    
+    Used as default_factory for "created" fields. Callers that build many
+    objects for one response (model lists, streaming chunks) should read
+    the clock once and pass "created" explicitly instead.
+    """
+    return int(time.time())
+
+
 # ==================================================================================================
 # Models for /v1/models endpoint
 # ==================================================================================================
@@ -42,7 +53,7 @@ class OpenAIModel(BaseModel):
     """
     id: str
     object: str = "model"
-    created: int = Field(default_factory=lambda: int(time.time()))
+    created: int = Field(default_factory=_unix_timestamp)
     owned_by: str = "anthropic"
     description: Optional[str] = None
 
@@ -70,18 +81,16 @@ class ChatMessage(BaseModel):
     
     Attributes:
         role: Sender role (user, assistant, system, tool)
-        content: Message content (can be string, list, or None)
+        content: Message content (can be string, list, object, or None)
         name: Optional sender name
         tool_calls: List of tool calls (for assistant)
         tool_call_id: Tool call ID (for tool)
     """
     role: str
-    content: Optional[Union[str, List[Any], Any]] = None
+    content: Optional[Union[str, List[Any], Dict[str, Any]]] = None
     name: Optional[str] = None
     tool_calls: Optional[List[Any]] = None
     tool_call_id: Optional[str] = None
-    
-    model_config = {"extra": "allow"}
 
 
 class ToolFunction(BaseModel):
@@ -121,8 +130,6 @@ class Tool(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
     input_schema: Optional[Dict[str, Any]] = None
-    
-    model_config = {"extra": "allow"}
 
 
 class ChatCompletionRequest(BaseModel):
@@ -176,8 +183,6 @@ class ChatCompletionRequest(BaseModel):
     user: Optional[str] = None
     seed: Optional[int] = None
     parallel_tool_calls: Optional[bool] = None
-    
-    model_config = {"extra": "allow"}
 
 
 # ==================================================================================================
@@ -228,7 +233,7 @@ class ChatCompletionResponse(BaseModel):
     """
     id: str
     object: str = "chat.completion"
-    created: int = Field(default_factory=lambda: int(time.time()))
+    created: int = Field(default_factory=_unix_timestamp)
     model: str
     choices: List[ChatCompletionChoice]
     usage: ChatCompletionUsage
@@ -276,7 +281,7 @@ class ChatCompletionChunk(BaseModel):
     """
     id: str
     object: str = "chat.completion.chunk"
-    created: int = Field(default_factory=lambda: int(time.time()))
+    created: int = Field(default_factory=_unix_timestamp)
     model: str
     choices: List[ChatCompletionChunkChoice]
     usage: Optional[ChatCompletionUsage] = None
\ No newline at end of file
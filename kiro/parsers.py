@@ -33,7 +33,7 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
-from kiro.utils import generate_tool_call_id
+from kiro.utils import generate_tool_call_id, json_loads
 
 
 def find_matching_brace(text: str, start_pos: int) -> int:
@@ -296,7 +296,7 @@ class AwsEventStreamParser:
             self.buffer = self.buffer[json_end + 1:]
             
             try:
-                data = json.loads(json_str)
+                data = json_loads(json_str)
                 event = self._process_event(data, earliest_type)
                 if event:
                     events.append(event)
@@ -401,7 +401,10 @@ class AwsEventStreamParser:
         args = self.current_tool_call['function']['arguments']
         tool_name = self.current_tool_call['function'].get('name', 'unknown')
         
-        logger.debug(f"Finalizing tool call '{tool_name}' with raw arguments: {repr(args)[:200]}")
+        # Lazy: repr() of multi-megabyte arguments is skipped unless a DEBUG sink is active
+        logger.opt(lazy=True).debug(
+            "Finalizing tool call '{}' with raw arguments: {}", lambda: tool_name, lambda: repr(args)[:200]
+        )
         
         if isinstance(args, str):
             if args.strip():
@@ -409,7 +412,11 @@ class AwsEventStreamParser:
                     parsed = json.loads(args)
                     # Ensure result is a JSON string
                     self.current_tool_call['function']['arguments'] = json.dumps(parsed)
-                    logger.debug(f"Tool '{tool_name}' arguments parsed successfully: {list(parsed.keys()) if isinstance(parsed, dict) else type(parsed)}")
+                    logger.opt(lazy=True).debug(
+                        "Tool '{}' arguments parsed successfully: {}",
+                        lambda: tool_name,
+                        lambda: list(parsed.keys()) if isinstance(parsed, dict) else type(parsed)
+                    )
                 except json.JSONDecodeError as e:
                     # Analyze the failure to provide better diagnostics
                     truncation_info = self._diagnose_json_truncation(args)
@@ -443,7 +450,9 @@ class AwsEventStreamParser:
         elif isinstance(args, dict):
             # If already an object - serialize to string
             self.current_tool_call['function']['arguments'] = json.dumps(args)
-            logger.debug(f"Tool '{tool_name}' arguments already dict with keys: {list(args.keys())}")
+            logger.opt(lazy=True).debug(
+                "Tool '{}' arguments already dict with keys: {}", lambda: tool_name, lambda: list(args.keys())
+            )
         else:
             # Unknown type - empty object
             logger.warning(f"Tool '{tool_name}' has unexpected arguments type: {type(args)}")
@@ -25,23 +25,26 @@ Contains the /v1/messages endpoint compatible with Anthropic's Messages API.
 Reference: https://docs.anthropic.com/en/api/messages
 """
 
+import hmac
 import json
-from typing import Optional
+from typing import List, Optional
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request, Security, Header
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
 from loguru import logger
+from pydantic import TypeAdapter
 
 from kiro.config import PROXY_API_KEY
 from kiro.models_anthropic import (
+    AnthropicMessage,
     AnthropicMessagesRequest,
     AnthropicMessagesResponse,
     AnthropicErrorResponse,
     AnthropicErrorDetail,
 )
-from kiro.auth import KiroAuthManager, AuthType
+from kiro.auth import KiroAuthManager
 from kiro.cache import ModelInfoCache
 from kiro.converters_anthropic import anthropic_to_kiro
 from kiro.streaming_anthropic import (
@@ -49,7 +52,10 @@ from kiro.streaming_anthropic import (
     collect_anthropic_response,
 )
 from kiro.http_client import KiroHttpClient
-from kiro.utils import generate_conversation_id
+from kiro.kiro_errors import read_kiro_error_message
+from kiro.truncation_state import get_tool_truncation, get_content_truncation, has_pending_truncations
+from kiro.truncation_recovery import generate_truncation_tool_result, generate_truncation_user_message
+from kiro.utils import generate_conversation_id, json_dumps_pretty
 from kiro.tokenizer import count_tools_tokens
 
 # Import debug_logger
@@ -64,6 +70,10 @@ except ImportError:
 anthropic_api_key_header = APIKeyHeader(name="x-api-key", auto_error=False)
 # Also support Authorization: Bearer for compatibility
 auth_header = APIKeyHeader(name="Authorization", auto_error=False)
+# Expected values are fixed at startup - build them once, not per request.
+# Kept as bytes for hmac.compare_digest (constant-time, accepts non-ASCII input)
+_EXPECTED_API_KEY = PROXY_API_KEY.encode("utf-8")
+_EXPECTED_AUTH_HEADER = f"Bearer {PROXY_API_KEY}".encode("utf-8")
 
 
 async def verify_anthropic_api_key(
@@ -87,15 +97,19 @@ async def verify_anthropic_api_key(
     Raises:
         HTTPException: 401 if key is invalid or missing
     """
-    # Check x-api-key first (Anthropic native)
-    if x_api_key and x_api_key == PROXY_API_KEY:
-        return True
-    
-    # Fall back to Authorization: Bearer
-    if authorization and authorization == f"Bearer {PROXY_API_KEY}":
-        return True
-    
-    logger.warning("Access attempt with invalid API key (Anthropic endpoint)")
+    # An empty PROXY_API_KEY must never authorize an empty key
+    if not PROXY_API_KEY:
+        logger.error("Request rejected: PROXY_API_KEY is empty. Set it in .env or the environment and restart.")
+    else:
+        # Check x-api-key first (Anthropic native)
+        if x_api_key and hmac.compare_digest(x_api_key.encode("utf-8"), _EXPECTED_API_KEY):
+            return True
+        
+        # Fall back to Authorization: Bearer
+        if authorization and hmac.compare_digest(authorization.encode("utf-8"), _EXPECTED_AUTH_HEADER):
+            return True
+        
+        logger.warning("Access attempt with invalid API key (Anthropic endpoint)")
     raise HTTPException(
         status_code=401,
         detail={
@@ -108,6 +122,11 @@ async def verify_anthropic_api_key(
     )
 
 
+# Whole-list dumper for the tokenizer: one pydantic-core call per list
+# instead of a model_dump() call per message
+_MESSAGES_DUMPER = TypeAdapter(List[AnthropicMessage])
+
+
 # --- Router ---
 router = APIRouter(tags=["Anthropic API"])
 
@@ -146,22 +165,23 @@ async def messages(
     if anthropic_version:
         logger.debug(f"Anthropic-Version header: {anthropic_version}")
     
-    auth_manager: KiroAuthManager = request.app.state.auth_manager
-    model_cache: ModelInfoCache = request.app.state.model_cache
+    # Resolve app state once; everything below uses these locals
+    state = request.app.state
+    auth_manager: KiroAuthManager = state.auth_manager
+    model_cache: ModelInfoCache = state.model_cache
     
     # Note: prepare_new_request() and log_request_body() are now called by DebugLoggerMiddleware
     # This ensures debug logging works even for requests that fail Pydantic validation (422 errors)
     
     # Check for truncation recovery opportunities
-    from kiro.truncation_state import get_tool_truncation, get_content_truncation
-    from kiro.truncation_recovery import generate_truncation_tool_result, generate_truncation_user_message
-    from kiro.models_anthropic import AnthropicMessage
-    
     modified_messages = []
     tool_results_modified = 0
     content_notices_added = 0
     
-    for msg in request_data.messages:
+    # Nothing truncated (the usual case) - skip the scan and its content hashing
+    messages_to_scan = request_data.messages if has_pending_truncations() else ()
+    
+    for msg in messages_to_scan:
         # Check if this is a user message with tool_result blocks
         if msg.role == "user" and msg.content and isinstance(msg.content, list):
             modified_content_blocks = []
@@ -251,16 +271,12 @@ async def messages(
     conversation_id = generate_conversation_id()
     
     # Build payload for Kiro
-    # profileArn is only needed for Kiro Desktop auth
-    profile_arn_for_payload = ""
-    if auth_manager.auth_type == AuthType.KIRO_DESKTOP and auth_manager.profile_arn:
-        profile_arn_for_payload = auth_manager.profile_arn
-    
+    # profileArn is only needed for Kiro Desktop auth (effective_profile_arn is "" otherwise)
     try:
         kiro_payload = anthropic_to_kiro(
             request_data,
             conversation_id,
-            profile_arn_for_payload
+            auth_manager.effective_profile_arn
         )
     except ValueError as e:
         logger.error(f"Conversion error: {e}")
@@ -275,18 +291,17 @@ async def messages(
             }
         )
     
-    # Log Kiro payload
-    try:
-        kiro_request_body = json.dumps(kiro_payload, ensure_ascii=False, indent=2).encode('utf-8')
-        if debug_logger:
-            debug_logger.log_kiro_request_body(kiro_request_body)
-    except Exception as e:
-        logger.warning(f"Failed to log Kiro request: {e}")
+    # Log Kiro payload (pretty-printing is skipped entirely when debug logging is off)
+    if debug_logger and debug_logger.is_enabled():
+        try:
+            debug_logger.log_kiro_request_body(json_dumps_pretty(kiro_payload))
+        except Exception as e:
+            logger.warning(f"Failed to log Kiro request: {e}")
     
     # Create HTTP client with retry logic
     # For streaming: use per-request client to avoid CLOSE_WAIT leak on VPN disconnect (issue #54)
     # For non-streaming: use shared client for connection pooling
-    url = f"{auth_manager.api_host}/generateAssistantResponse"
+    url = auth_manager.generate_url
     logger.debug(f"Kiro API URL: {url}")
     
     if request_data.stream:
@@ -295,14 +310,15 @@ async def messages(
         http_client = KiroHttpClient(auth_manager, shared_client=None)
     else:
         # Non-streaming mode: shared client for efficient connection reuse
-        shared_client = request.app.state.http_client
+        shared_client = state.http_client
         http_client = KiroHttpClient(auth_manager, shared_client=shared_client)
     
     # Prepare data for token counting
     # Convert Pydantic models to dicts for tokenizer
-    messages_for_tokenizer = [msg.model_dump() for msg in request_data.messages]
-    tools_for_tokenizer = [tool.model_dump() for tool in request_data.tools] if request_data.tools else None
+    messages_for_tokenizer = _MESSAGES_DUMPER.dump_python(request_data.messages)
     
+    # Closed once in the finally below; a returned stream_wrapper takes over closing it
+    close_client = True
     try:
         # Make request to Kiro API (for both streaming and non-streaming modes)
         # Important: we wait for Kiro response BEFORE returning StreamingResponse,
@@ -315,26 +331,7 @@ async def messages(
         )
         
         if response.status_code != 200:
-            try:
-                error_content = await response.aread()
-            except Exception:
-                error_content = b"Unknown error"
-            
-            await http_client.close()
-            error_text = error_content.decode('utf-8', errors='replace')
-            
-            # Try to parse JSON response from Kiro to extract error message
-            error_message = error_text
-            try:
-                error_json = json.loads(error_text)
-                # Enhance Kiro API errors with user-friendly messages
-                from kiro.kiro_errors import enhance_kiro_error
-                error_info = enhance_kiro_error(error_json)
-                error_message = error_info.user_message
-                # Log original error for debugging
-                logger.debug(f"Original Kiro error: {error_info.original_message} (reason: {error_info.reason})")
-            except (json.JSONDecodeError, KeyError):
-                pass
+            error_message = await read_kiro_error_message(response)
             
             # Log access log for error (before flush, so it gets into app_logs)
             logger.warning(
@@ -389,9 +386,9 @@ async def messages(
                         error_msg = str(streaming_error) if str(streaming_error) else "(empty message)"
                         logger.error(f"HTTP 500 - POST /v1/messages (streaming) - [{error_type}] {error_msg[:100]}")
                     elif client_disconnected:
-                        logger.info(f"HTTP 200 - POST /v1/messages (streaming) - client disconnected")
+                        logger.info("HTTP 200 - POST /v1/messages (streaming) - client disconnected")
                     else:
-                        logger.info(f"HTTP 200 - POST /v1/messages (streaming) - completed")
+                        logger.info("HTTP 200 - POST /v1/messages (streaming) - completed")
                     
                     if debug_logger:
                         if streaming_error:
@@ -399,6 +396,7 @@ async def messages(
                         else:
                             debug_logger.discard_buffers()
             
+            close_client = False
             return StreamingResponse(
                 stream_wrapper(),
                 media_type="text/event-stream",
@@ -418,9 +416,7 @@ async def messages(
                 request_messages=messages_for_tokenizer
             )
             
-            await http_client.close()
-            
-            logger.info(f"HTTP 200 - POST /v1/messages (non-streaming) - completed")
+            logger.info("HTTP 200 - POST /v1/messages (non-streaming) - completed")
             
             if debug_logger:
                 debug_logger.discard_buffers()
@@ -428,13 +424,11 @@ async def messages(
             return JSONResponse(content=anthropic_response)
     
     except HTTPException as e:
-        await http_client.close()
         logger.error(f"HTTP {e.status_code} - POST /v1/messages - {e.detail}")
         if debug_logger:
             debug_logger.flush_on_error(e.status_code, str(e.detail))
         raise
     except Exception as e:
-        await http_client.close()
         logger.error(f"Internal error: {e}", exc_info=True)
         logger.error(f"HTTP 500 - POST /v1/messages - {str(e)[:100]}")
         if debug_logger:
@@ -449,4 +443,7 @@ async def messages(
                     "message": f"Internal Server Error: {str(e)}"
                 }
             }
-        )
\ No newline at end of file
+        )
+    finally:
+        if close_client:
+            await http_client.close()
\ No newline at end of file
@@ -26,13 +26,15 @@ Contains all API endpoints:
 - /v1/chat/completions: Chat completions
 """
 
-import json
-from datetime import datetime, timezone
+import hmac
+import time
+from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, Security
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
 from loguru import logger
+from pydantic import TypeAdapter
 
 from kiro.config import (
     PROXY_API_KEY,
@@ -41,15 +43,20 @@ from kiro.config import (
 from kiro.models_openai import (
     OpenAIModel,
     ModelList,
+    ChatMessage,
     ChatCompletionRequest,
+    Tool,
 )
-from kiro.auth import KiroAuthManager, AuthType
+from kiro.auth import KiroAuthManager
 from kiro.cache import ModelInfoCache
 from kiro.model_resolver import ModelResolver
 from kiro.converters_openai import build_kiro_payload
 from kiro.streaming_openai import stream_kiro_to_openai, collect_stream_response, stream_with_first_token_retry
 from kiro.http_client import KiroHttpClient
-from kiro.utils import generate_conversation_id
+from kiro.kiro_errors import read_kiro_error_message
+from kiro.truncation_state import get_tool_truncation, get_content_truncation, has_pending_truncations
+from kiro.truncation_recovery import generate_truncation_tool_result, generate_truncation_user_message
+from kiro.utils import generate_conversation_id, json_dumps_pretty
 
 # Import debug_logger
 try:
@@ -60,6 +67,9 @@ except ImportError:
 
 # --- Security scheme ---
 api_key_header = APIKeyHeader(name="Authorization", auto_error=False)
+# Expected header value is fixed at startup - build it once, not per request.
+# Kept as bytes for hmac.compare_digest (constant-time, accepts non-ASCII input)
+_EXPECTED_AUTH_HEADER = f"Bearer {PROXY_API_KEY}".encode("utf-8")
 
 
 async def verify_api_key(auth_header: str = Security(api_key_header)) -> bool:
@@ -77,15 +87,38 @@ async def verify_api_key(auth_header: str = Security(api_key_header)) -> bool:
     Raises:
         HTTPException: 401 if key is invalid or missing
     """
-    if not auth_header or auth_header != f"Bearer {PROXY_API_KEY}":
+    if not PROXY_API_KEY:
+        logger.error("Request rejected: PROXY_API_KEY is empty. Set it in .env or the environment and restart.")
+        raise HTTPException(status_code=401, detail="Invalid or missing API Key")
+    if not auth_header or not hmac.compare_digest(auth_header.encode("utf-8"), _EXPECTED_AUTH_HEADER):
         logger.warning("Access attempt with invalid API key.")
         raise HTTPException(status_code=401, detail="Invalid or missing API Key")
     return True
 
 
+# Whole-list dumpers for the tokenizer: one pydantic-core call per list
+# instead of a model_dump() call per message
+_MESSAGES_DUMPER = TypeAdapter(List[ChatMessage])
+_TOOLS_DUMPER = TypeAdapter(List[Tool])
+
+
 # --- Router ---
 router = APIRouter()
 
+# Health check bodies are constant after startup - build them once
+# instead of allocating a new dict on every probe
+_ROOT_RESPONSE = {
+    "status": "ok",
+    "message": "Kiro Gateway is running",
+    "version": APP_VERSION
+}
+_HEALTH_STATIC_FIELDS = {
+    "status": "healthy",
+    "version": APP_VERSION
+}
+# ISO 8601 UTC, second precision; strftime on gmtime is much cheaper than datetime.isoformat()
+_ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%S+00:00"
+
 
 @router.get("/")
 async def root():
@@ -95,11 +128,7 @@ async def root():
     Returns:
         Status and application version
     """
-    return {
-        "status": "ok",
-        "message": "Kiro Gateway is running",
-        "version": APP_VERSION
-    }
+    return _ROOT_RESPONSE
 
 
 @router.get("/health")
@@ -107,13 +136,14 @@ async def health():
     """
     Detailed health check.
     
+    Only the timestamp is computed per request; the rest is prebuilt.
+    
     Returns:
         Status, timestamp and version
     """
     return {
-        "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": APP_VERSION
+        **_HEALTH_STATIC_FIELDS,
+        "timestamp": time.strftime(_ISO_UTC_FORMAT, time.gmtime()),
     }
 
 @router.get("/v1/models", response_model=ModelList, dependencies=[Depends(verify_api_key)])
@@ -122,7 +152,8 @@ async def get_models(request: Request):
     Return list of available models.
     
     Models are loaded at startup (blocking) and cached.
-    This endpoint returns the cached list.
+    This endpoint returns the cached list. The serialized ModelList is kept
+    on app.state and only rebuilt when the model cache version changes.
     
     Args:
         request: FastAPI Request for accessing app.state
@@ -132,22 +163,33 @@ async def get_models(request: Request):
     """
     logger.info("Request to /v1/models")
     
-    model_resolver: ModelResolver = request.app.state.model_resolver
+    state = request.app.state
+    model_resolver: ModelResolver = state.model_resolver
+    
+    version = model_resolver.cache.version
+    cached = getattr(state, "models_response", None)
+    if cached is not None and cached[0] == version:
+        return Response(content=cached[1], media_type="application/json")
     
     # Get all available models from resolver (cache + hidden models)
     available_model_ids = model_resolver.get_available_models()
     
     # Build OpenAI-compatible model list
+    # All entries share one "created" value instead of reading the clock per model
+    created = int(time.time())
     openai_models = [
         OpenAIModel(
             id=model_id,
+            created=created,
             owned_by="anthropic",
             description="Claude model via Kiro API"
         )
         for model_id in available_model_ids
     ]
     
-    return ModelList(data=openai_models)
+    content = ModelList(data=openai_models).model_dump_json().encode("utf-8")
+    state.models_response = (version, content)
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/v1/chat/completions", dependencies=[Depends(verify_api_key)])
@@ -171,22 +213,23 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
     """
     logger.info(f"Request to /v1/chat/completions (model={request_data.model}, stream={request_data.stream})")
     
-    auth_manager: KiroAuthManager = request.app.state.auth_manager
-    model_cache: ModelInfoCache = request.app.state.model_cache
+    # Resolve app state once; everything below uses these locals
+    state = request.app.state
+    auth_manager: KiroAuthManager = state.auth_manager
+    model_cache: ModelInfoCache = state.model_cache
     
     # Note: prepare_new_request() and log_request_body() are now called by DebugLoggerMiddleware
     # This ensures debug logging works even for requests that fail Pydantic validation (422 errors)
     
     # Check for truncation recovery opportunities
-    from kiro.truncation_state import get_tool_truncation, get_content_truncation
-    from kiro.truncation_recovery import generate_truncation_tool_result, generate_truncation_user_message
-    from kiro.models_openai import ChatMessage
-    
     modified_messages = []
     tool_results_modified = 0
     content_notices_added = 0
     
-    for msg in request_data.messages:
+    # Nothing truncated (the usual case) - skip the scan and its content hashing
+    messages_to_scan = request_data.messages if has_pending_truncations() else ()
+    
+    for msg in messages_to_scan:
         # Check if this is a tool_result for a truncated tool call
         if msg.role == "tool" and msg.tool_call_id:
             truncation_info = get_tool_truncation(msg.tool_call_id)
@@ -233,33 +276,27 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
     conversation_id = generate_conversation_id()
     
     # Build payload for Kiro
-    # profileArn is only needed for Kiro Desktop auth
-    # AWS SSO OIDC (Builder ID) users don't need profileArn and it causes 403 if sent
-    profile_arn_for_payload = ""
-    if auth_manager.auth_type == AuthType.KIRO_DESKTOP and auth_manager.profile_arn:
-        profile_arn_for_payload = auth_manager.profile_arn
-    
+    # profileArn is only needed for Kiro Desktop auth (effective_profile_arn is "" otherwise)
     try:
         kiro_payload = build_kiro_payload(
             request_data,
             conversation_id,
-            profile_arn_for_payload
+            auth_manager.effective_profile_arn
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
-    # Log Kiro payload
-    try:
-        kiro_request_body = json.dumps(kiro_payload, ensure_ascii=False, indent=2).encode('utf-8')
-        if debug_logger:
-            debug_logger.log_kiro_request_body(kiro_request_body)
-    except Exception as e:
-        logger.warning(f"Failed to log Kiro request: {e}")
+    # Log Kiro payload (pretty-printing is skipped entirely when debug logging is off)
+    if debug_logger and debug_logger.is_enabled():
+        try:
+            debug_logger.log_kiro_request_body(json_dumps_pretty(kiro_payload))
+        except Exception as e:
+            logger.warning(f"Failed to log Kiro request: {e}")
     
     # Create HTTP client with retry logic
     # For streaming: use per-request client to avoid CLOSE_WAIT leak on VPN disconnect (issue #54)
     # For non-streaming: use shared client for connection pooling
-    url = f"{auth_manager.api_host}/generateAssistantResponse"
+    url = auth_manager.generate_url
     logger.debug(f"Kiro API URL: {url}")
     
     if request_data.stream:
@@ -268,8 +305,10 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
         http_client = KiroHttpClient(auth_manager, shared_client=None)
     else:
         # Non-streaming mode: shared client for efficient connection reuse
-        shared_client = request.app.state.http_client
+        shared_client = state.http_client
         http_client = KiroHttpClient(auth_manager, shared_client=shared_client)
+    # Closed once in the finally below; a returned stream_wrapper takes over closing it
+    close_client = True
     try:
         # Make request to Kiro API (for both streaming and non-streaming modes)
         # Important: we wait for Kiro response BEFORE returning StreamingResponse,
@@ -282,26 +321,7 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
         )
         
         if response.status_code != 200:
-            try:
-                error_content = await response.aread()
-            except Exception:
-                error_content = b"Unknown error"
-            
-            await http_client.close()
-            error_text = error_content.decode('utf-8', errors='replace')
-            
-            # Try to parse JSON response from Kiro to extract error message
-            error_message = error_text
-            try:
-                error_json = json.loads(error_text)
-                # Enhance Kiro API errors with user-friendly messages
-                from kiro.kiro_errors import enhance_kiro_error
-                error_info = enhance_kiro_error(error_json)
-                error_message = error_info.user_message
-                # Log original error for debugging
-                logger.debug(f"Original Kiro error: {error_info.original_message} (reason: {error_info.reason})")
-            except (json.JSONDecodeError, KeyError):
-                pass
+            error_message = await read_kiro_error_message(response)
             
             # Log access log for error (before flush, so it gets into app_logs)
             logger.warning(
@@ -326,8 +346,8 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
         
         # Prepare data for fallback token counting
         # Convert Pydantic models to dicts for tokenizer
-        messages_for_tokenizer = [msg.model_dump() for msg in request_data.messages]
-        tools_for_tokenizer = [tool.model_dump() for tool in request_data.tools] if request_data.tools else None
+        messages_for_tokenizer = _MESSAGES_DUMPER.dump_python(request_data.messages)
+        tools_for_tokenizer = _TOOLS_DUMPER.dump_python(request_data.tools) if request_data.tools else None
         
         if request_data.stream:
             # Streaming mode
@@ -366,9 +386,9 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
                         error_msg = str(streaming_error) if str(streaming_error) else "(empty message)"
                         logger.error(f"HTTP 500 - POST /v1/chat/completions (streaming) - [{error_type}] {error_msg[:100]}")
                     elif client_disconnected:
-                        logger.info(f"HTTP 200 - POST /v1/chat/completions (streaming) - client disconnected")
+                        logger.info("HTTP 200 - POST /v1/chat/completions (streaming) - client disconnected")
                     else:
-                        logger.info(f"HTTP 200 - POST /v1/chat/completions (streaming) - completed")
+                        logger.info("HTTP 200 - POST /v1/chat/completions (streaming) - completed")
                     # Write debug logs AFTER streaming completes
                     if debug_logger:
                         if streaming_error:
@@ -376,6 +396,7 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
                         else:
                             debug_logger.discard_buffers()
             
+            close_client = False
             return StreamingResponse(stream_wrapper(), media_type="text/event-stream")
         
         else:
@@ -391,10 +412,8 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
                 request_tools=tools_for_tokenizer
             )
             
-            await http_client.close()
-            
             # Log access log for non-streaming success
-            logger.info(f"HTTP 200 - POST /v1/chat/completions (non-streaming) - completed")
+            logger.info("HTTP 200 - POST /v1/chat/completions (non-streaming) - completed")
             
             # Write debug logs after non-streaming request completes
             if debug_logger:
@@ -403,7 +422,6 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
             return JSONResponse(content=openai_response)
     
     except HTTPException as e:
-        await http_client.close()
         # Log access log for HTTP error
         logger.error(f"HTTP {e.status_code} - POST /v1/chat/completions - {e.detail}")
         # Flush debug logs on HTTP error ("errors" mode)
@@ -411,11 +429,13 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
             debug_logger.flush_on_error(e.status_code, str(e.detail))
         raise
     except Exception as e:
-        await http_client.close()
         logger.error(f"Internal error: {e}", exc_info=True)
         # Log access log for internal error
         logger.error(f"HTTP 500 - POST /v1/chat/completions - {str(e)[:100]}")
         # Flush debug logs on internal error ("errors" mode)
         if debug_logger:
             debug_logger.flush_on_error(500, str(e))
-        raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
+    finally:
+        if close_client:
+            await http_client.close()
\ No newline at end of file
@@ -33,7 +33,7 @@ Reference: https://docs.anthropic.com/en/api/messages-streaming
 
 import json
 import time
-import uuid
+import secrets
 from typing import TYPE_CHECKING, AsyncGenerator, Dict, List, Optional, Any
 
 import httpx
@@ -64,7 +64,7 @@ except ImportError:
 
 def generate_message_id() -> str:
     """Generate unique message ID in Anthropic format."""
-    return f"msg_{uuid.uuid4().hex[:24]}"
+    return f"msg_{secrets.token_hex(12)}"
 
 
 def format_sse_event(event_type: str, data: Dict[str, Any]) -> str:
@@ -95,7 +95,7 @@ def generate_thinking_signature() -> str:
     Returns:
         Placeholder signature string
     """
-    return f"sig_{uuid.uuid4().hex[:32]}"
+    return f"sig_{secrets.token_hex(16)}"
 
 
 async def stream_kiro_to_anthropic(
@@ -298,7 +298,7 @@ async def stream_kiro_to_anthropic(
                     current_block_index += 1
                 
                 tool = event.tool_use
-                tool_id = tool.get("id") or f"toolu_{uuid.uuid4().hex[:24]}"
+                tool_id = tool.get("id") or f"toolu_{secrets.token_hex(12)}"
                 tool_name = tool.get("function", {}).get("name", "") or tool.get("name", "")
                 tool_input = tool.get("function", {}).get("arguments", {}) or tool.get("input", {})
                 
@@ -381,7 +381,7 @@ async def stream_kiro_to_anthropic(
                 current_block_index += 1
             
             for tc in bracket_tool_calls:
-                tool_id = tc.get("id") or f"toolu_{uuid.uuid4().hex[:24]}"
+                tool_id = tc.get("id") or f"toolu_{secrets.token_hex(12)}"
                 tool_name = tc.get("function", {}).get("name", "")
                 tool_input = tc.get("function", {}).get("arguments", {})
                 
@@ -597,7 +597,7 @@ async def collect_anthropic_response(
     
     # Add tool use blocks
     for tc in result.tool_calls:
-        tool_id = tc.get("id") or f"toolu_{uuid.uuid4().hex[:24]}"
+        tool_id = tc.get("id") or f"toolu_{secrets.token_hex(12)}"
         tool_name = tc.get("function", {}).get("name", "") or tc.get("name", "")
         tool_input = tc.get("function", {}).get("arguments", {}) or tc.get("input", {})
         
@@ -30,14 +30,14 @@ Uses streaming_core.py for parsing Kiro stream into unified KiroEvent objects.
 
 import json
 import time
-from typing import TYPE_CHECKING, AsyncGenerator, Callable, Awaitable, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Awaitable, Optional, Tuple
 
 import httpx
 from fastapi import HTTPException
 from loguru import logger
 
 from kiro.parsers import parse_bracket_tool_calls, deduplicate_tool_calls
-from kiro.utils import generate_completion_id
+from kiro.utils import generate_completion_id, json_loads
 from kiro.config import (
     FIRST_TOKEN_TIMEOUT,
     FIRST_TOKEN_MAX_RETRIES,
@@ -69,6 +69,46 @@ except ImportError:
 __all__ = ['FirstTokenTimeoutError', 'stream_kiro_to_openai', 'stream_with_first_token_retry', 'collect_stream_response']
 
 
+# Placeholder for the delta value when pre-rendering a chunk template
+_DELTA_PLACEHOLDER = "__kiro_gateway_delta__"
+
+
+def _build_delta_chunk_template(
+    completion_id: str,
+    created: int,
+    model: str,
+    delta_key: str
+) -> Tuple[str, str]:
+    """
+    Pre-renders the SSE line for a single-field delta chunk.
+    
+    Only the delta text changes between chunks of one response, so the
+    surrounding JSON is serialized once and each token becomes
+    prefix + json.dumps(text) + suffix. The result is byte-identical to
+    json.dumps() of the full chunk dict.
+    
+    Args:
+        completion_id: Completion ID shared by all chunks
+        created: Creation timestamp shared by all chunks
+        model: Model name shared by all chunks
+        delta_key: Delta field to fill ("content" or "reasoning_content")
+    
+    Returns:
+        Tuple of (prefix, suffix) strings around the JSON-encoded delta value
+    """
+    chunk = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": model,
+        "choices": [{"index": 0, "delta": {delta_key: _DELTA_PLACEHOLDER}, "finish_reason": None}]
+    }
+    rendered = f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+    # rpartition: the delta is the last string in the chunk, even if model contains the placeholder
+    prefix, _, suffix = rendered.rpartition(json.dumps(_DELTA_PLACEHOLDER))
+    return prefix, suffix
+
+
 async def stream_kiro_to_openai_internal(
     client: httpx.AsyncClient,
     response: httpx.Response,
@@ -118,6 +158,18 @@ async def stream_kiro_to_openai_internal(
     created_time = int(time.time())
     first_chunk = True
     
+    # Chunks after the first differ only in delta text - render the rest once
+    content_prefix, content_suffix = _build_delta_chunk_template(
+        completion_id, created_time, model, "content"
+    )
+    thinking_key = "reasoning_content" if FAKE_REASONING_HANDLING == "as_reasoning_content" else "content"
+    thinking_prefix, thinking_suffix = _build_delta_chunk_template(
+        completion_id, created_time, model, thinking_key
+    )
+    
+    # Decided once per stream: skips a UTF-8 encode per token when debug logging is off
+    log_chunks = debug_logger is not None and debug_logger.is_enabled()
+    
     metering_data = None
     context_usage_percentage = None
     full_content = ""
@@ -135,22 +187,20 @@ async def stream_kiro_to_openai_internal(
                 full_content += event.content
                 
                 # Format as OpenAI chunk
-                delta = {"content": event.content}
                 if first_chunk:
-                    delta["role"] = "assistant"
+                    openai_chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created_time,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": event.content, "role": "assistant"}, "finish_reason": None}]
+                    }
+                    chunk_text = f"data: {json.dumps(openai_chunk, ensure_ascii=False)}\n\n"
                     first_chunk = False
+                else:
+                    chunk_text = content_prefix + json.dumps(event.content, ensure_ascii=False) + content_suffix
                 
-                openai_chunk = {
-                    "id": completion_id,
-                    "object": "chat.completion.chunk",
-                    "created": created_time,
-                    "model": model,
-                    "choices": [{"index": 0, "delta": delta, "finish_reason": None}]
-                }
-                
-                chunk_text = f"data: {json.dumps(openai_chunk, ensure_ascii=False)}\n\n"
-                
-                if debug_logger:
+                if log_chunks:
                     debug_logger.log_modified_chunk(chunk_text.encode('utf-8'))
                 
                 yield chunk_text
@@ -160,26 +210,20 @@ async def stream_kiro_to_openai_internal(
                 full_thinking_content += event.thinking_content
                 
                 # Send as reasoning_content or content based on mode
-                if FAKE_REASONING_HANDLING == "as_reasoning_content":
-                    delta = {"reasoning_content": event.thinking_content}
-                else:
-                    delta = {"content": event.thinking_content}
-                
                 if first_chunk:
-                    delta["role"] = "assistant"
+                    openai_chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created_time,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {thinking_key: event.thinking_content, "role": "assistant"}, "finish_reason": None}]
+                    }
+                    chunk_text = f"data: {json.dumps(openai_chunk, ensure_ascii=False)}\n\n"
                     first_chunk = False
+                else:
+                    chunk_text = thinking_prefix + json.dumps(event.thinking_content, ensure_ascii=False) + thinking_suffix
                 
-                openai_chunk = {
-                    "id": completion_id,
-                    "object": "chat.completion.chunk",
-                    "created": created_time,
-                    "model": model,
-                    "choices": [{"index": 0, "delta": delta, "finish_reason": None}]
-                }
-                
-                chunk_text = f"data: {json.dumps(openai_chunk, ensure_ascii=False)}\n\n"
-                
-                if debug_logger:
+                if log_chunks:
                     debug_logger.log_modified_chunk(chunk_text.encode('utf-8'))
                 
                 yield chunk_text
@@ -514,8 +558,9 @@ async def collect_stream_response(
     Returns:
         Dictionary with full response in OpenAI chat.completion format
     """
-    full_content = ""
-    full_reasoning_content = ""
+    # Accumulate text parts and join once at the end
+    content_parts = []
+    reasoning_parts = []
     final_usage = None
     tool_calls = []
     completion_id = generate_completion_id()
@@ -537,14 +582,14 @@ async def collect_stream_response(
             continue
         
         try:
-            chunk_data = json.loads(data_str)
+            chunk_data = json_loads(data_str)
             
             # Extract data from chunk
             delta = chunk_data.get("choices", [{}])[0].get("delta", {})
             if "content" in delta:
-                full_content += delta["content"]
+                content_parts.append(delta["content"])
             if "reasoning_content" in delta:
-                full_reasoning_content += delta["reasoning_content"]
+                reasoning_parts.append(delta["reasoning_content"])
             if "tool_calls" in delta:
                 tool_calls.extend(delta["tool_calls"])
             
@@ -556,6 +601,8 @@ async def collect_stream_response(
             continue
     
     # Form final response
+    full_content = "".join(content_parts)
+    full_reasoning_content = "".join(reasoning_parts)
     message = {"role": "assistant", "content": full_content}
     if full_reasoning_content:
         message["reasoning_content"] = full_reasoning_content
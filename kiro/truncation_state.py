@@ -72,12 +72,33 @@ class ContentTruncationInfo:
 # Entries persist until:
 # 1. Retrieved via get_* functions (one-time retrieval deletes entry)
 # 2. Gateway restart (in-memory cache is cleared)
-# No TTL - if user takes a break for hours, truncation info should still be available
+# 3. Evicted oldest-first once a cache holds MAX_CACHE_ENTRIES
+# No TTL - if user takes a break for hours, truncation info should still be available.
+# The size cap only bounds memory for truncations whose follow-up request never
+# arrives (abandoned conversations): an entry is dropped only after MAX_CACHE_ENTRIES
+# newer truncations were saved, whatever its age.
+MAX_CACHE_ENTRIES = 1000
 _tool_truncation_cache: Dict[str, ToolTruncationInfo] = {}
 _content_truncation_cache: Dict[str, ContentTruncationInfo] = {}
 _cache_lock = Lock()
 
 
+def _evict_oldest(cache: Dict) -> None:
+    """
+    Drop the oldest entries until the cache is within MAX_CACHE_ENTRIES.
+    
+    Dicts keep insertion order, so the first keys are the oldest.
+    Must be called with _cache_lock held.
+    
+    Args:
+        cache: One of the truncation caches
+    """
+    while len(cache) > MAX_CACHE_ENTRIES:
+        oldest_key = next(iter(cache))
+        del cache[oldest_key]
+        logger.debug(f"Evicted oldest truncation entry {oldest_key} (cache limit {MAX_CACHE_ENTRIES})")
+
+
 def save_tool_truncation(tool_call_id: str, tool_name: str, truncation_info: Dict) -> None:
     """
     Save truncation info for a specific tool call.
@@ -100,6 +121,7 @@ def save_tool_truncation(tool_call_id: str, tool_name: str, truncation_info: Dic
             timestamp=time.time()
         )
         _tool_truncation_cache[tool_call_id] = info
+        _evict_oldest(_tool_truncation_cache)
         logger.debug(f"Saved tool truncation for {tool_call_id} ({tool_name})")
 
 
@@ -155,6 +177,7 @@ def save_content_truncation(content: str) -> str:
             timestamp=time.time()
         )
         _content_truncation_cache[message_hash] = info
+        _evict_oldest(_content_truncation_cache)
         logger.debug(f"Saved content truncation with hash {message_hash}")
     
     return message_hash
@@ -190,6 +213,21 @@ def get_content_truncation(content: str) -> Optional[ContentTruncationInfo]:
         return info
 
 
+def has_pending_truncations() -> bool:
+    """
+    Check whether any truncation info is waiting to be consumed.
+    
+    Lets request handlers skip the per-message recovery scan (and the
+    content hashing it does) when nothing has been truncated, which is
+    the common case. Reads dict sizes without the lock - a stale answer
+    only delays recovery to the next request.
+    
+    Returns:
+        True if either the tool or the content cache is non-empty
+    """
+    return bool(_tool_truncation_cache) or bool(_content_truncation_cache)
+
+
 
 
 def get_cache_stats() -> Dict[str, int]:
@@ -24,17 +24,74 @@ Contains functions for fingerprint generation, header formatting,
 and other common utilities.
 """
 
+import getpass
 import hashlib
 import json
+import secrets
+import socket
 import uuid
-from typing import TYPE_CHECKING, List, Dict, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple, Union
 
 from loguru import logger
 
+# orjson is optional - it parses JSON several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from kiro.auth import KiroAuthManager
 
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses JSON using orjson when available, falling back to stdlib json.
+    
+    Used on hot parsing paths (Kiro stream events, API responses).
+    If orjson rejects the input (e.g. integers above 64 bits), the stdlib
+    parser gets a second chance, so behavior matches json.loads().
+    
+    Args:
+        data: JSON document as str or bytes
+    
+    Returns:
+        Parsed Python object
+    
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps_pretty(data: Any) -> bytes:
+    """
+    Serializes data as indented UTF-8 JSON, using orjson when available.
+    
+    Used for debug dumps of request payloads, which can be hundreds of KB.
+    Falls back to stdlib json (same layout: 2-space indent, non-ASCII kept)
+    if orjson is missing or rejects the data (e.g. integers above 64 bits).
+    
+    Args:
+        data: JSON-serializable object
+    
+    Returns:
+        Indented JSON document as bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def get_machine_fingerprint() -> str:
     """
     Generates a unique machine fingerprint based on hostname and username.
@@ -45,9 +102,6 @@ def get_machine_fingerprint() -> str:
         SHA256 hash of the string "{hostname}-{username}-kiro-gateway"
     """
     try:
-        import socket
-        import getpass
-        
         hostname = socket.gethostname()
         username = getpass.getuser()
         unique_string = f"{hostname}-{username}-kiro-gateway"
@@ -58,6 +112,26 @@ def get_machine_fingerprint() -> str:
         return hashlib.sha256(b"default-kiro-gateway").hexdigest()
 
 
+@lru_cache(maxsize=32)
+def _user_agent_headers(fingerprint: str) -> Tuple[str, str]:
+    """
+    Builds the User-Agent and x-amz-user-agent values for a fingerprint.
+    
+    The fingerprint is fixed per auth manager, so both strings are
+    formatted once and reused for every request.
+    
+    Args:
+        fingerprint: Machine fingerprint from the auth manager
+    
+    Returns:
+        Tuple of (User-Agent, x-amz-user-agent)
+    """
+    return (
+        f"aws-sdk-js/1.0.27 ua/2.1 os/win32#10.0.19044 lang/js md/nodejs#22.21.1 api/codewhispererstreaming#1.0.27 m/E KiroIDE-0.7.45-{fingerprint}",
+        f"aws-sdk-js/1.0.27 KiroIDE-0.7.45-{fingerprint}",
+    )
+
+
 def get_kiro_headers(auth_manager: "KiroAuthManager", token: str) -> dict:
     """
     Builds headers for Kiro API requests.
@@ -74,13 +148,13 @@ def get_kiro_headers(auth_manager: "KiroAuthManager", token: str) -> dict:
     Returns:
         Dictionary with headers for HTTP request
     """
-    fingerprint = auth_manager.fingerprint
+    user_agent, amz_user_agent = _user_agent_headers(auth_manager.fingerprint)
     
     return {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-        "User-Agent": f"aws-sdk-js/1.0.27 ua/2.1 os/win32#10.0.19044 lang/js md/nodejs#22.21.1 api/codewhispererstreaming#1.0.27 m/E KiroIDE-0.7.45-{fingerprint}",
-        "x-amz-user-agent": f"aws-sdk-js/1.0.27 KiroIDE-0.7.45-{fingerprint}",
+        "User-Agent": user_agent,
+        "x-amz-user-agent": amz_user_agent,
         "x-amzn-codewhisperer-optout": "true",
         "x-amzn-kiro-agent-mode": "vibe",
         "amz-sdk-invocation-id": str(uuid.uuid4()),
@@ -92,20 +166,26 @@ def generate_completion_id() -> str:
     """
     Generates a unique ID for chat completion.
     
+    Uses secrets.token_hex() - same 32 hex chars as uuid4().hex,
+    without building a UUID object.
+    
     Returns:
-        ID in format "chatcmpl-{uuid_hex}"
+        ID in format "chatcmpl-{32 hex chars}"
     """
-    return f"chatcmpl-{uuid.uuid4().hex}"
+    return f"chatcmpl-{secrets.token_hex(16)}"
 
 
 def generate_conversation_id(messages: List[Dict[str, Any]] = None) -> str:
     """
     Generates a stable conversation ID based on message history.
     
-    For truncation recovery, we need a stable ID that persists across requests
-    in the same conversation. This is generated from a hash of key messages.
+    The same key messages always produce the same ID, generated from a hash
+    of the first three messages and the last one.
     
     If no messages provided, falls back to random UUID (for backward compatibility).
+    Both routes currently call it without messages, so requests get a random
+    UUID and the hashing branch is unused. Truncation recovery does not use
+    conversation IDs (see truncation_state).
     
     Args:
         messages: List of messages in the conversation (optional)
@@ -167,6 +247,6 @@ def generate_tool_call_id() -> str:
     Generates a unique ID for tool call.
     
     Returns:
-        ID in format "call_{uuid_hex[:8]}"
+        ID in format "call_{8 hex chars}"
     """
-    return f"call_{uuid.uuid4().hex[:8]}"
\ No newline at end of file
+    return f"call_{secrets.token_hex(4)}"
\ No newline at end of file
@@ -200,11 +200,22 @@ if VPN_PROXY_URL:
 
 
 # --- Configuration Validation ---
+_EMPTY_PROXY_API_KEY_ERROR = (
+    "PROXY_API_KEY is empty - every API request would be rejected with 401!\n"
+    "\n"
+    "   Set your super-secret password as PROXY_API_KEY in .env or the environment:\n"
+    "   PROXY_API_KEY=\"my-super-secret-password-123\"\n"
+    "\n"
+    "   Clients send the same value as \"Authorization: Bearer ...\" or \"x-api-key: ...\"."
+)
+
+
 def validate_configuration() -> None:
     """
     Validates that required configuration is present.
     
     Checks:
+    - PROXY_API_KEY is not empty (an empty key rejects every request)
     - Either REFRESH_TOKEN, KIRO_CREDS_FILE, or KIRO_CLI_DB_FILE is configured
     - Supports both .env file (local) and environment variables (Docker)
     
@@ -216,6 +227,11 @@ def validate_configuration() -> None:
     # Check if .env file exists (optional - can use environment variables)
     env_file = Path(".env")
     
+    # An empty PROXY_API_KEY never authorizes anything - fail fast instead of
+    # answering every request with a bare 401
+    if not PROXY_API_KEY:
+        errors.append(_EMPTY_PROXY_API_KEY_ERROR)
+    
     # Check for credentials (from .env or environment variables)
     has_refresh_token = bool(REFRESH_TOKEN)
     has_creds_file = bool(KIRO_CREDS_FILE)
@@ -313,6 +329,12 @@ async def lifespan(app: FastAPI):
     """
     logger.info("Starting application... Creating state managers.")
     
+    # validate_configuration() only runs for `python main.py`; when served by
+    # `uvicorn main:app` this is the first place an empty key can be reported
+    if not PROXY_API_KEY:
+        for line in _EMPTY_PROXY_API_KEY_ERROR.split('\n'):
+            logger.error(line)
+    
     # Create shared HTTP client with connection pooling
     # This reduces memory usage and enables connection reuse across requests
     # Limits: max 100 total connections, max 20 keep-alive connections
@@ -354,32 +376,33 @@ async def lifespan(app: FastAPI):
     logger.info("Loading models from Kiro API...")
     try:
         token = await app.state.auth_manager.get_access_token()
-        from kiro.utils import get_kiro_headers
-        from kiro.auth import AuthType
+        from kiro.utils import get_kiro_headers, json_loads
         headers = get_kiro_headers(app.state.auth_manager, token)
         
         # Build params - profileArn is only needed for Kiro Desktop auth
         params = {"origin": "AI_EDITOR"}
-        if app.state.auth_manager.auth_type == AuthType.KIRO_DESKTOP and app.state.auth_manager.profile_arn:
-            params["profileArn"] = app.state.auth_manager.profile_arn
+        if app.state.auth_manager.effective_profile_arn:
+            params["profileArn"] = app.state.auth_manager.effective_profile_arn
         
         list_models_url = f"{app.state.auth_manager.q_host}/ListAvailableModels"
         logger.debug(f"Fetching models from: {list_models_url}")
         
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                list_models_url,
-                headers=headers,
-                params=params
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                models_list = data.get("models", [])
-                await app.state.model_cache.update(models_list)
-                logger.debug(f"Successfully loaded {len(models_list)} models from Kiro API")
-            else:
-                raise Exception(f"HTTP {response.status_code}")
+        # Reuse the shared client (its connection stays in the pool for the first
+        # chat request); override the long streaming read timeout for this call
+        response = await app.state.http_client.get(
+            list_models_url,
+            headers=headers,
+            params=params,
+            timeout=30
+        )
+        
+        if response.status_code == 200:
+            data = json_loads(response.content)
+            models_list = data.get("models", [])
+            await app.state.model_cache.update(models_list)
+            logger.debug(f"Successfully loaded {len(models_list)} models from Kiro API")
+        else:
+            raise Exception(f"HTTP {response.status_code}")
     except Exception as e:
         # FALLBACK: Use built-in model list
         logger.error(f"Failed to fetch models from Kiro API: {e}")
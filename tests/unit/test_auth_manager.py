@@ -488,6 +488,60 @@ class TestKiroAuthManagerProperties:
         assert "q.us-east-1.amazonaws.com" in manager.api_host
         assert "us-east-1" in manager.api_host
     
+    def test_generate_url_property(self):
+        """
+        What it does: Verifies generate_url property.
+        Purpose: Ensure the prebuilt generateAssistantResponse URL matches api_host.
+        """
+        print("Setup: Creating KiroAuthManager...")
+        manager = KiroAuthManager(
+            refresh_token="test",
+            region="eu-west-1"
+        )
+        
+        print(f"generate_url: {manager.generate_url}")
+        assert manager.generate_url == f"{manager.api_host}/generateAssistantResponse"
+    
+    def test_effective_profile_arn_for_kiro_desktop(self):
+        """
+        What it does: Verifies effective_profile_arn for Kiro Desktop auth.
+        Purpose: Ensure profileArn is sent for Kiro Desktop users.
+        """
+        print("Setup: Creating KiroAuthManager with profile_arn (Kiro Desktop)...")
+        manager = KiroAuthManager(
+            refresh_token="test",
+            profile_arn="arn:aws:test:profile"
+        )
+        
+        print(f"auth_type: {manager.auth_type}, effective_profile_arn: {manager.effective_profile_arn}")
+        assert manager.auth_type == AuthType.KIRO_DESKTOP
+        assert manager.effective_profile_arn == "arn:aws:test:profile"
+    
+    def test_effective_profile_arn_empty_for_aws_sso_oidc(self):
+        """
+        What it does: Verifies effective_profile_arn is empty for AWS SSO OIDC auth.
+        Purpose: Ensure profileArn is never sent for Builder ID users (causes 403).
+        """
+        print("Setup: Creating KiroAuthManager with profile_arn, switching to AWS SSO OIDC...")
+        manager = KiroAuthManager(
+            refresh_token="test",
+            profile_arn="arn:aws:test:profile"
+        )
+        manager._auth_type = AuthType.AWS_SSO_OIDC
+        
+        print(f"effective_profile_arn: {manager.effective_profile_arn!r}")
+        assert manager.effective_profile_arn == ""
+    
+    def test_effective_profile_arn_empty_without_profile_arn(self):
+        """
+        What it does: Verifies effective_profile_arn is empty when no profile_arn is set.
+        Purpose: Ensure an empty string (not None) is passed to payload builders.
+        """
+        manager = KiroAuthManager(refresh_token="test")
+        
+        print(f"effective_profile_arn: {manager.effective_profile_arn!r}")
+        assert manager.effective_profile_arn == ""
+    
     def test_fingerprint_property(self):
         """
         What it does: Verifies fingerprint property.
@@ -2037,6 +2091,179 @@ class TestKiroAuthManagerGracefulDegradation:
             assert exc_info.value.response.status_code == 400
 
 
+# =============================================================================
+# Tests for _save_credentials_to_file()
+# =============================================================================
+
+class TestKiroAuthManagerSaveCredentialsToFile:
+    """Tests for _save_credentials_to_file() method."""
+    
+    def test_save_credentials_to_file_updates_and_preserves_fields(self, temp_creds_file):
+        """
+        What it does: Verifies refreshed tokens are written while other fields are kept.
+        Purpose: Ensure the atomic rewrite produces the same file contents as before.
+        """
+        print("Setup: Creating manager from credentials file...")
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._access_token = "new_access_token"
+        manager._refresh_token = "new_refresh_token"
+        
+        print("Action: Calling _save_credentials_to_file()...")
+        manager._save_credentials_to_file()
+        
+        with open(temp_creds_file, 'r', encoding='utf-8') as f:
+            saved_data = json.load(f)
+        print(f"Saved data: {saved_data}")
+        assert saved_data['accessToken'] == "new_access_token"
+        assert saved_data['refreshToken'] == "new_refresh_token"
+        assert saved_data['region'] == "us-east-1"
+    
+    def test_save_credentials_to_file_keeps_permissions_and_leaves_no_temp_file(self, temp_creds_file):
+        """
+        What it does: Verifies the file mode survives the rename and no .tmp file remains.
+        Purpose: Ensure atomic replace does not widen access to credentials.
+        """
+        import os
+        from pathlib import Path
+        
+        print("Setup: Restricting credentials file to 0600...")
+        os.chmod(temp_creds_file, 0o600)
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._access_token = "new_access_token"
+        
+        print("Action: Calling _save_credentials_to_file()...")
+        manager._save_credentials_to_file()
+        
+        mode = os.stat(temp_creds_file).st_mode & 0o777
+        leftovers = list(Path(temp_creds_file).parent.glob("*.tmp"))
+        print(f"Mode: {oct(mode)}, leftover temp files: {leftovers}")
+        assert mode == 0o600
+        assert leftovers == []
+    
+    def test_save_credentials_to_file_removes_temp_file_when_replace_fails(self, temp_creds_file):
+        """
+        What it does: Verifies a failed rename removes the temp file and keeps the original.
+        Purpose: Ensure refreshed tokens are never left behind in a stray .tmp file.
+        """
+        import errno
+        import os
+        from pathlib import Path
+        
+        print("Setup: Restricting credentials file to 0600...")
+        os.chmod(temp_creds_file, 0o600)
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._access_token = "new_access_token"
+        
+        print("Action: Calling _save_credentials_to_file() with os.replace failing (EIO)...")
+        with patch("kiro.auth.os.replace", side_effect=OSError(errno.EIO, "I/O error")):
+            manager._save_credentials_to_file()
+        
+        with open(temp_creds_file, 'r', encoding='utf-8') as f:
+            saved_data = json.load(f)
+        mode = os.stat(temp_creds_file).st_mode & 0o777
+        leftovers = list(Path(temp_creds_file).parent.glob("*.tmp"))
+        print(f"Saved data: {saved_data}, mode: {oct(mode)}, leftover temp files: {leftovers}")
+        assert saved_data['accessToken'] == "file_access_token"
+        assert mode == 0o600
+        assert leftovers == []
+    
+    @pytest.mark.parametrize("error_code", ["EBUSY", "EXDEV", "EACCES", "EROFS"])
+    def test_save_credentials_to_file_falls_back_to_in_place_write(self, temp_creds_file, error_code):
+        """
+        What it does: Verifies tokens are written in place when the rename cannot work.
+        Purpose: Ensure bind-mounted files and unwritable directories still get refreshed tokens.
+        """
+        import errno
+        import os
+        from pathlib import Path
+        
+        print("Setup: Restricting credentials file to 0600...")
+        os.chmod(temp_creds_file, 0o600)
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._access_token = "new_access_token"
+        manager._refresh_token = "new_refresh_token"
+        
+        print(f"Action: Calling _save_credentials_to_file() with os.replace failing ({error_code})...")
+        code = getattr(errno, error_code)
+        with patch("kiro.auth.os.replace", side_effect=OSError(code, os.strerror(code))):
+            manager._save_credentials_to_file()
+        
+        with open(temp_creds_file, 'r', encoding='utf-8') as f:
+            saved_data = json.load(f)
+        mode = os.stat(temp_creds_file).st_mode & 0o777
+        leftovers = list(Path(temp_creds_file).parent.glob("*.tmp"))
+        print(f"Saved data: {saved_data}, mode: {oct(mode)}, leftover temp files: {leftovers}")
+        assert saved_data['accessToken'] == "new_access_token"
+        assert saved_data['refreshToken'] == "new_refresh_token"
+        assert saved_data['region'] == "us-east-1"
+        assert mode == 0o600
+        assert leftovers == []
+    
+    def test_save_credentials_to_file_falls_back_when_temp_file_cannot_be_created(self, temp_creds_file):
+        """
+        What it does: Verifies an unwritable directory (EACCES on create) falls back to in-place write.
+        Purpose: Ensure the refresh token is still saved where only the file itself is writable.
+        """
+        import errno
+        
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._access_token = "new_access_token"
+        
+        print("Action: Calling _save_credentials_to_file() with temp file creation denied...")
+        with patch("kiro.auth.os.open", side_effect=PermissionError(errno.EACCES, "Permission denied")):
+            manager._save_credentials_to_file()
+        
+        with open(temp_creds_file, 'r', encoding='utf-8') as f:
+            saved_data = json.load(f)
+        print(f"Saved data: {saved_data}")
+        assert saved_data['accessToken'] == "new_access_token"
+    
+    def test_save_credentials_to_file_creates_temp_file_with_target_mode(self, temp_creds_file):
+        """
+        What it does: Verifies the temp file is created exclusively with the target's mode.
+        Purpose: Ensure tokens are never on disk with umask-default (e.g. 0644) permissions.
+        """
+        import os
+        
+        print("Setup: Restricting credentials file to 0600...")
+        os.chmod(temp_creds_file, 0o600)
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._access_token = "new_access_token"
+        
+        print("Action: Calling _save_credentials_to_file() with os.open spied...")
+        with patch("kiro.auth.os.open", wraps=os.open) as mock_open:
+            manager._save_credentials_to_file()
+        
+        path, flags, mode = mock_open.call_args.args
+        print(f"os.open called with: {path}, flags={flags}, mode={oct(mode)}")
+        assert str(path).endswith(".tmp")
+        assert flags & os.O_EXCL
+        assert flags & os.O_CREAT
+        assert mode == 0o600
+    
+    def test_save_credentials_to_file_replaces_stale_temp_file(self, temp_creds_file):
+        """
+        What it does: Verifies a .tmp file left by an interrupted save does not block saving.
+        Purpose: Ensure O_EXCL creation does not fail forever after one crash.
+        """
+        from pathlib import Path
+        
+        print("Setup: Leaving a stale temp file next to the credentials...")
+        stale = Path(temp_creds_file + ".tmp")
+        stale.write_text("stale")
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._access_token = "new_access_token"
+        
+        print("Action: Calling _save_credentials_to_file()...")
+        manager._save_credentials_to_file()
+        
+        with open(temp_creds_file, 'r', encoding='utf-8') as f:
+            saved_data = json.load(f)
+        print(f"Saved data: {saved_data}, stale exists: {stale.exists()}")
+        assert saved_data['accessToken'] == "new_access_token"
+        assert not stale.exists()
+
+
 # =============================================================================
 # Tests for _save_credentials_to_sqlite() - NEW FUNCTIONALITY
 # =============================================================================
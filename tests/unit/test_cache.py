@@ -97,6 +97,30 @@ class TestModelInfoCacheUpdate:
         assert cache.last_update_time is not None
         assert before_update <= cache.last_update_time <= after_update
     
+    @pytest.mark.asyncio
+    async def test_update_bumps_version(self, sample_models_data):
+        """
+        Что он делает: Проверяет увеличение version при каждом изменении кэша.
+        Цель: Убедиться, что производные кэши (список моделей) инвалидируются.
+        """
+        print("Настройка: Создание ModelInfoCache...")
+        cache = ModelInfoCache()
+        initial_version = cache.version
+        
+        print("Действие: Обновление кэша...")
+        await cache.update(sample_models_data)
+        after_update = cache.version
+        
+        print("Действие: Добавление скрытой модели (дважды)...")
+        cache.add_hidden_model("hidden-model", "HIDDEN_ID")
+        after_hidden = cache.version
+        cache.add_hidden_model("hidden-model", "HIDDEN_ID")
+        
+        print(f"Версии: {initial_version} -> {after_update} -> {after_hidden} -> {cache.version}")
+        assert after_update > initial_version
+        assert after_hidden > after_update
+        assert cache.version == after_hidden  # Повторное добавление ничего не меняет
+    
     @pytest.mark.asyncio
     async def test_update_replaces_existing_data(self, sample_models_data):
         """
@@ -386,7 +386,7 @@ class TestDebugLoggerHelperMethods:
     
     def test_is_enabled_returns_true_for_errors(self):
         """
-        Что он делает: Проверяет _is_enabled() для режима errors.
+        Что он делает: Проверяет is_enabled() для режима errors.
         Цель: Убедиться, что режим errors считается включённым.
         """
         print("Настройка: Режим errors...")
@@ -396,12 +396,12 @@ class TestDebugLoggerHelperMethods:
             logger._initialized = False
             logger.__init__()
             
-            print(f"Проверяем _is_enabled()...")
-            assert logger._is_enabled() is True
+            print(f"Проверяем is_enabled()...")
+            assert logger.is_enabled() is True
     
     def test_is_enabled_returns_true_for_all(self):
         """
-        Что он делает: Проверяет _is_enabled() для режима all.
+        Что он делает: Проверяет is_enabled() для режима all.
         Цель: Убедиться, что режим all считается включённым.
         """
         print("Настройка: Режим all...")
@@ -411,12 +411,12 @@ class TestDebugLoggerHelperMethods:
             logger._initialized = False
             logger.__init__()
             
-            print(f"Проверяем _is_enabled()...")
-            assert logger._is_enabled() is True
+            print(f"Проверяем is_enabled()...")
+            assert logger.is_enabled() is True
     
     def test_is_enabled_returns_false_for_off(self):
         """
-        Что он делает: Проверяет _is_enabled() для режима off.
+        Что он делает: Проверяет is_enabled() для режима off.
         Цель: Убедиться, что режим off считается выключенным.
         """
         print("Настройка: Режим off...")
@@ -426,8 +426,8 @@ class TestDebugLoggerHelperMethods:
             logger._initialized = False
             logger.__init__()
             
-            print(f"Проверяем _is_enabled()...")
-            assert logger._is_enabled() is False
+            print(f"Проверяем is_enabled()...")
+            assert logger.is_enabled() is False
     
     def test_is_immediate_write_returns_true_for_all(self):
         """
@@ -346,6 +346,98 @@ class TestDebugLoggerMiddlewareResponsePassthrough:
                 assert actual_response.status_code == 200
 
 
+class TestDebugLoggerMiddlewareAsgiFastPath:
+    """Tests for the ASGI-level pass-through that bypasses dispatch()."""
+    
+    @pytest.mark.asyncio
+    async def test_bypasses_dispatch_when_debug_mode_off(self):
+        """
+        What it does: Verifies that API requests go straight to the app when DEBUG_MODE=off.
+        Purpose: Ensure BaseHTTPMiddleware machinery is skipped in the default configuration.
+        """
+        with patch('kiro.debug_middleware.DEBUG_MODE', 'off'):
+            from kiro.debug_middleware import DebugLoggerMiddleware
+            
+            inner_app = AsyncMock()
+            middleware = DebugLoggerMiddleware(app=inner_app)
+            scope = {"type": "http", "path": "/v1/chat/completions"}
+            receive, send = AsyncMock(), AsyncMock()
+            
+            with patch.object(DebugLoggerMiddleware, 'dispatch') as mock_dispatch:
+                print("Action: Calling middleware as ASGI app...")
+                await middleware(scope, receive, send)
+                
+                print("Verifying app was called directly and dispatch was skipped...")
+                inner_app.assert_awaited_once_with(scope, receive, send)
+                mock_dispatch.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_bypasses_dispatch_for_unlogged_path(self):
+        """
+        What it does: Verifies that non-API paths go straight to the app even with DEBUG_MODE=all.
+        Purpose: Ensure health checks never pay the middleware overhead.
+        """
+        with patch('kiro.debug_middleware.DEBUG_MODE', 'all'):
+            from kiro.debug_middleware import DebugLoggerMiddleware
+            
+            inner_app = AsyncMock()
+            middleware = DebugLoggerMiddleware(app=inner_app)
+            scope = {"type": "http", "path": "/health"}
+            receive, send = AsyncMock(), AsyncMock()
+            
+            print("Action: Calling middleware as ASGI app for /health...")
+            await middleware(scope, receive, send)
+            
+            inner_app.assert_awaited_once_with(scope, receive, send)
+    
+    @pytest.mark.asyncio
+    async def test_bypasses_dispatch_for_non_http_scope(self):
+        """
+        What it does: Verifies that lifespan/websocket scopes are passed through.
+        Purpose: Ensure non-HTTP scopes without a path do not break the fast path.
+        """
+        with patch('kiro.debug_middleware.DEBUG_MODE', 'all'):
+            from kiro.debug_middleware import DebugLoggerMiddleware
+            
+            inner_app = AsyncMock()
+            middleware = DebugLoggerMiddleware(app=inner_app)
+            scope = {"type": "lifespan"}
+            receive, send = AsyncMock(), AsyncMock()
+            
+            print("Action: Calling middleware with lifespan scope...")
+            await middleware(scope, receive, send)
+            
+            inner_app.assert_awaited_once_with(scope, receive, send)
+    
+    def test_logged_request_still_goes_through_dispatch(self):
+        """
+        What it does: Verifies that logged API requests still reach dispatch().
+        Purpose: Ensure the raw body is still captured when debug logging is on.
+        """
+        with patch('kiro.debug_middleware.DEBUG_MODE', 'all'):
+            from starlette.applications import Starlette
+            from starlette.responses import PlainTextResponse
+            from starlette.routing import Route
+            from starlette.testclient import TestClient
+            from kiro.debug_middleware import DebugLoggerMiddleware
+            
+            async def endpoint(request):
+                return PlainTextResponse("ok")
+            
+            app = Starlette(routes=[Route("/v1/messages", endpoint, methods=["POST"])])
+            app.add_middleware(DebugLoggerMiddleware)
+            
+            with patch('kiro.debug_logger.debug_logger') as mock_logger:
+                print("Action: POST /v1/messages through the middleware...")
+                response = TestClient(app).post("/v1/messages", content=b'{"a": 1}')
+                
+                print(f"Status: {response.status_code}")
+                assert response.status_code == 200
+                assert response.text == "ok"
+                mock_logger.prepare_new_request.assert_called_once()
+                mock_logger.log_request_body.assert_called_once_with(b'{"a": 1}')
+
+
 class TestLoggedEndpointsConstant:
     """Tests for LOGGED_ENDPOINTS constant."""
     
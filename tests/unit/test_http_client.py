@@ -122,6 +122,30 @@ class TestKiroHttpClientGetClient:
             print("Verification: New client created...")
             mock_async_client.assert_called_once()
             assert client is mock_new
+    
+    @pytest.mark.asyncio
+    async def test_per_request_clients_share_ssl_context(self, mock_auth_manager_for_http):
+        """
+        What it does: Verifies per-request clients reuse one TLS context.
+        Purpose: Ensure the CA bundle is not reloaded for every streaming request.
+        """
+        from kiro.http_client import get_ssl_context
+        
+        print("Setup: Creating two per-request KiroHttpClients...")
+        first = KiroHttpClient(mock_auth_manager_for_http)
+        second = KiroHttpClient(mock_auth_manager_for_http)
+        
+        print("Action: Getting streaming clients...")
+        with patch('kiro.http_client.httpx.AsyncClient') as mock_async_client:
+            mock_async_client.return_value = AsyncMock(is_closed=False)
+            await first._get_client(stream=True)
+            await second._get_client(stream=True)
+        
+        verify_args = [c.kwargs.get('verify') for c in mock_async_client.call_args_list]
+        print(f"verify arguments: {verify_args}")
+        assert len(verify_args) == 2
+        assert verify_args[0] is get_ssl_context()
+        assert verify_args[1] is verify_args[0]
 
 
 class TestKiroHttpClientClose:
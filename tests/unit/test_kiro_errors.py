@@ -2,14 +2,18 @@
 
 """
 Unit tests for Kiro API error enhancement system.
-Tests enhance_kiro_error() function and KiroErrorInfo dataclass.
+Tests enhance_kiro_error() function, KiroErrorInfo dataclass
+and read_kiro_error_message() helper.
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from kiro.kiro_errors import (
     KiroErrorInfo,
-    enhance_kiro_error
+    enhance_kiro_error,
+    read_kiro_error_message
 )
 
 
@@ -471,3 +475,57 @@ class TestEnhanceKiroErrorIntegration:
         assert info1.original_message == "Error 1"
         assert info2.original_message == "Error 2"
         assert info3.original_message == "Error 3"
+
+
+class TestReadKiroErrorMessage:
+    """Tests for read_kiro_error_message() shared by the routes."""
+    
+    @pytest.mark.asyncio
+    async def test_json_error_is_enhanced(self):
+        """
+        What it does: Verifies a Kiro error JSON body is turned into the enhanced message.
+        Purpose: Ensure routes keep returning user-friendly messages after the refactor.
+        """
+        print("Setup: Mock response with CONTENT_LENGTH_EXCEEDS_THRESHOLD body...")
+        response = MagicMock()
+        response.aread = AsyncMock(
+            return_value=b'{"message": "Input is too long.", "reason": "CONTENT_LENGTH_EXCEEDS_THRESHOLD"}'
+        )
+        
+        print("Action: Reading error message...")
+        message = await read_kiro_error_message(response)
+        
+        print(f"Result: {message}")
+        assert message == "Model context limit reached. Conversation size exceeds model capacity."
+    
+    @pytest.mark.asyncio
+    async def test_non_json_body_returned_as_text(self):
+        """
+        What it does: Verifies a non-JSON body is returned as decoded text.
+        Purpose: Ensure plain-text upstream errors are passed through unchanged.
+        """
+        print("Setup: Mock response with plain-text body...")
+        response = MagicMock()
+        response.aread = AsyncMock(return_value="Service Unavailable — try later".encode("utf-8"))
+        
+        print("Action: Reading error message...")
+        message = await read_kiro_error_message(response)
+        
+        print(f"Result: {message}")
+        assert message == "Service Unavailable — try later"
+    
+    @pytest.mark.asyncio
+    async def test_read_failure_returns_unknown_error(self):
+        """
+        What it does: Verifies a failing body read falls back to "Unknown error".
+        Purpose: Ensure a broken error response still produces a message.
+        """
+        print("Setup: Mock response whose aread() raises...")
+        response = MagicMock()
+        response.aread = AsyncMock(side_effect=Exception("Connection reset"))
+        
+        print("Action: Reading error message...")
+        message = await read_kiro_error_message(response)
+        
+        print(f"Result: {message}")
+        assert message == "Unknown error"
@@ -2,13 +2,15 @@
 
 """
 Unit tests for main.py CLI functions.
-Tests for parse_cli_args(), resolve_server_config(), and print_startup_banner().
+Tests for parse_cli_args(), resolve_server_config(), print_startup_banner(),
+validate_configuration() and the lifespan startup checks.
 """
 
 import pytest
 import argparse
 import sys
-from unittest.mock import patch, MagicMock
+import httpx
+from unittest.mock import patch, MagicMock, AsyncMock, Mock
 from io import StringIO
 
 
@@ -406,4 +408,232 @@ class TestCliVersion:
         print(f"Version output: {captured.out}")
         print(f"APP_VERSION: {APP_VERSION}")
         
-        assert APP_VERSION in captured.out
\ No newline at end of file
+        assert APP_VERSION in captured.out
+
+class TestValidateConfiguration:
+    """Tests for validate_configuration()."""
+    
+    def test_empty_proxy_api_key_exits_with_actionable_error(self):
+        """
+        What it does: Verifies an empty PROXY_API_KEY stops startup with an explanation.
+        Purpose: Ensure the gateway does not start only to answer every request with 401.
+        """
+        from loguru import logger
+        from main import validate_configuration
+        
+        print("Setup: Empty PROXY_API_KEY, valid refresh token, ERROR sink...")
+        messages = []
+        sink_id = logger.add(messages.append, level="ERROR", format="{message}")
+        try:
+            with patch("main.PROXY_API_KEY", ""), \
+                 patch("main.REFRESH_TOKEN", "test_refresh_token"):
+                print("Action: Calling validate_configuration()...")
+                with pytest.raises(SystemExit) as exc_info:
+                    validate_configuration()
+        finally:
+            logger.remove(sink_id)
+        
+        print(f"Exit code: {exc_info.value.code}, errors: {messages}")
+        assert exc_info.value.code == 1
+        assert any("PROXY_API_KEY is empty" in m for m in messages)
+        assert any("PROXY_API_KEY=" in m for m in messages)
+    
+    def test_non_empty_proxy_api_key_passes(self):
+        """
+        What it does: Verifies a configured key and refresh token pass validation.
+        Purpose: Ensure the empty-key check does not reject valid configuration.
+        """
+        from main import validate_configuration
+        
+        print("Setup: Non-empty PROXY_API_KEY and refresh token...")
+        with patch("main.PROXY_API_KEY", "test-key"), \
+             patch("main.REFRESH_TOKEN", "test_refresh_token"), \
+             patch("main.KIRO_CREDS_FILE", ""), \
+             patch("main.KIRO_CLI_DB_FILE", ""):
+            print("Action: Calling validate_configuration()...")
+            validate_configuration()
+        
+        print("Checking: No SystemExit raised")
+
+
+@pytest.fixture
+def lifespan_env():
+    """
+    Patches lifespan dependencies: shared HTTP client and auth manager.
+    
+    Returns a namespace with the mocked client and auth manager; the model
+    fetch answers with a two-model list unless a test overrides client.get.
+    """
+    from types import SimpleNamespace
+    
+    response = Mock(spec=httpx.Response)
+    response.status_code = 200
+    response.content = b'{"models": [{"modelId": "model-a"}, {"modelId": "model-b"}]}'
+    
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=response)
+    client.aclose = AsyncMock()
+    
+    auth_manager = Mock()
+    auth_manager.get_access_token = AsyncMock(return_value="test_access_token")
+    auth_manager.effective_profile_arn = "arn:aws:codewhisperer:us-east-1:123456789:profile/test"
+    auth_manager.q_host = "https://q.us-east-1.amazonaws.com"
+    auth_manager.fingerprint = "test_fingerprint"
+    
+    with patch("main.httpx.AsyncClient", return_value=client), \
+         patch("main.KiroAuthManager", return_value=auth_manager):
+        yield SimpleNamespace(client=client, auth_manager=auth_manager, response=response)
+
+
+async def run_lifespan():
+    """
+    Runs main.lifespan startup on a fresh FastAPI app and returns the app.
+    
+    Shutdown runs too, so the mocked client is closed before returning.
+    """
+    from fastapi import FastAPI
+    from main import lifespan
+    
+    app = FastAPI()
+    async with lifespan(app):
+        pass
+    return app
+
+
+class TestLifespanProxyApiKeyCheck:
+    """Tests for the empty PROXY_API_KEY error logged at startup."""
+    
+    @pytest.mark.asyncio
+    async def test_empty_proxy_api_key_logs_error_at_startup(self, lifespan_env):
+        """
+        What it does: Verifies lifespan logs an actionable error for an empty PROXY_API_KEY.
+        Purpose: Ensure `uvicorn main:app` launches (no validate_configuration) still explain the 401s.
+        """
+        from loguru import logger
+        
+        print("Setup: Empty PROXY_API_KEY and an ERROR sink...")
+        messages = []
+        sink_id = logger.add(messages.append, level="ERROR", format="{message}")
+        try:
+            with patch("main.PROXY_API_KEY", ""):
+                print("Action: Running lifespan...")
+                await run_lifespan()
+        finally:
+            logger.remove(sink_id)
+        
+        print(f"Errors: {messages}")
+        assert any("PROXY_API_KEY is empty" in m for m in messages)
+    
+    @pytest.mark.asyncio
+    async def test_configured_proxy_api_key_logs_no_error(self, lifespan_env):
+        """
+        What it does: Verifies no PROXY_API_KEY error is logged when the key is set.
+        Purpose: Ensure the startup check does not produce false alarms.
+        """
+        from loguru import logger
+        
+        messages = []
+        sink_id = logger.add(messages.append, level="ERROR", format="{message}")
+        try:
+            with patch("main.PROXY_API_KEY", "test-key"):
+                print("Action: Running lifespan...")
+                await run_lifespan()
+        finally:
+            logger.remove(sink_id)
+        
+        print(f"Errors: {messages}")
+        assert not any("PROXY_API_KEY" in m for m in messages)
+
+
+class TestLifespanModelFetch:
+    """Tests for the startup model list fetch in lifespan."""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_uses_shared_client_with_timeout_and_profile_arn(self, lifespan_env):
+        """
+        What it does: Verifies the model list is fetched through the shared client.
+        Purpose: Ensure the 30s timeout override, profileArn param and auth header are sent.
+        """
+        print("Action: Running lifespan...")
+        app = await run_lifespan()
+        
+        print(f"GET calls: {lifespan_env.client.get.await_args_list}")
+        lifespan_env.client.get.assert_awaited_once()
+        call = lifespan_env.client.get.await_args
+        assert call.args == ("https://q.us-east-1.amazonaws.com/ListAvailableModels",)
+        assert call.kwargs["timeout"] == 30
+        assert call.kwargs["params"] == {
+            "origin": "AI_EDITOR",
+            "profileArn": "arn:aws:codewhisperer:us-east-1:123456789:profile/test",
+        }
+        assert call.kwargs["headers"]["Authorization"] == "Bearer test_access_token"
+        
+        print("Checking: The same client is stored on app.state and closed at shutdown...")
+        assert app.state.http_client is lifespan_env.client
+        lifespan_env.client.aclose.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_omits_profile_arn_when_not_set(self, lifespan_env):
+        """
+        What it does: Verifies profileArn is not sent when effective_profile_arn is empty.
+        Purpose: Ensure AWS SSO OIDC setups (no profile ARN) get only the origin param.
+        """
+        lifespan_env.auth_manager.effective_profile_arn = ""
+        
+        print("Action: Running lifespan without a profile ARN...")
+        await run_lifespan()
+        
+        params = lifespan_env.client.get.await_args.kwargs["params"]
+        print(f"Params: {params}")
+        assert params == {"origin": "AI_EDITOR"}
+    
+    @pytest.mark.asyncio
+    async def test_successful_fetch_populates_cache_with_api_and_hidden_models(self, lifespan_env):
+        """
+        What it does: Verifies the parsed API models plus hidden models end up in the cache.
+        Purpose: Ensure json_loads parsing of the response body feeds the model cache.
+        """
+        from main import HIDDEN_MODELS, FALLBACK_MODELS
+        
+        print("Action: Running lifespan...")
+        app = await run_lifespan()
+        
+        model_ids = app.state.model_cache.get_all_model_ids()
+        print(f"Cached models: {model_ids}")
+        assert "model-a" in model_ids
+        assert "model-b" in model_ids
+        for display_name in HIDDEN_MODELS:
+            assert display_name in model_ids
+        for model in FALLBACK_MODELS:
+            assert model["modelId"] not in model_ids
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failure", ["http_error", "bad_json", "network_error", "token_error"])
+    async def test_failed_fetch_falls_back_to_default_and_hidden_models(self, lifespan_env, failure):
+        """
+        What it does: Verifies any fetch failure loads FALLBACK_MODELS plus hidden models.
+        Purpose: Ensure the gateway still starts with a usable model list.
+        """
+        from main import HIDDEN_MODELS, FALLBACK_MODELS
+        
+        print(f"Setup: Model fetch failure '{failure}'...")
+        if failure == "http_error":
+            lifespan_env.response.status_code = 500
+        elif failure == "bad_json":
+            lifespan_env.response.content = b"<html>not json</html>"
+        elif failure == "network_error":
+            lifespan_env.client.get.side_effect = httpx.ConnectError("connection refused")
+        else:
+            lifespan_env.auth_manager.get_access_token.side_effect = ValueError("no refresh token")
+        
+        print("Action: Running lifespan...")
+        app = await run_lifespan()
+        
+        model_ids = app.state.model_cache.get_all_model_ids()
+        print(f"Cached models: {model_ids}")
+        for model in FALLBACK_MODELS:
+            assert model["modelId"] in model_ids
+        for display_name in HIDDEN_MODELS:
+            assert display_name in model_ids
+        assert "model-a" not in model_ids
+        assert app.state.model_resolver is not None
@@ -859,6 +859,38 @@ class TestModelResolverGetAvailableModels:
         
         # Check uniqueness
         assert len(models) == len(set(models))
+    
+    def test_get_available_models_reflects_add_hidden_model(self, model_resolver):
+        """
+        What it does: Includes a model added via add_hidden_model() on the next call.
+        Goal: Check that the list always reflects the current cache contents.
+        """
+        first = model_resolver.get_available_models()
+        assert "claude-new-model" not in first
+        
+        print("Action: Adding hidden model to cache...")
+        model_resolver.cache.add_hidden_model("claude-new-model", "NEW_INTERNAL_ID")
+        models = model_resolver.get_available_models()
+        
+        print(f"Received models: {models}")
+        assert "claude-new-model" in models
+        assert models == sorted(models)
+    
+    @pytest.mark.asyncio
+    async def test_get_available_models_rebuilt_after_cache_update(self, model_resolver):
+        """
+        What it does: Rebuilds the list after ModelInfoCache.update().
+        Goal: Check that a refreshed model list is visible immediately.
+        """
+        model_resolver.get_available_models()
+        
+        print("Action: Updating cache with a new model list...")
+        await model_resolver.cache.update([{"modelId": "claude-fresh-5"}])
+        models = model_resolver.get_available_models()
+        
+        print(f"Received models: {models}")
+        assert "claude-fresh-5" in models
+        assert "claude-haiku-4.5" not in models
 
 
 class TestModelResolverGetModelsByFamily:
@@ -301,6 +301,26 @@ class TestChatMessage:
         assert isinstance(message.content, list)
         assert len(message.content) == 2
     
+    def test_accepts_dict_content(self):
+        """
+        What it does: Verifies that a single content object is accepted as-is.
+        Purpose: Ensure object content still validates after narrowing the union.
+        """
+        print("Setup: Creating ChatMessage with dict content...")
+        message = ChatMessage(role="user", content={"type": "text", "text": "Hello"})
+    
+        print(f"Comparing content: Got {message.content}")
+        assert message.content == {"type": "text", "text": "Hello"}
+    
+    def test_rejects_scalar_content(self):
+        """
+        What it does: Verifies that non-string scalar content is rejected.
+        Purpose: Ensure content union only has str, list and object arms.
+        """
+        print("Setup: Creating ChatMessage with integer content...")
+        with pytest.raises(ValidationError):
+            ChatMessage(role="user", content=42)
+    
     def test_accepts_tool_calls(self):
         """
         What it does: Verifies that tool_calls is accepted.
@@ -344,16 +364,18 @@ class TestChatMessage:
         print(f"Comparing name: Expected 'John', Got '{message.name}'")
         assert message.name == "John"
     
-    def test_extra_fields_allowed(self):
+    def test_extra_fields_ignored(self):
         """
-        What it does: Verifies that extra fields are allowed.
-        Purpose: Ensure model_config extra="allow" works.
+        What it does: Verifies that unknown fields are accepted but not stored.
+        Purpose: Ensure clients sending extra keys still validate without extras overhead.
         """
         print("Setup: Creating ChatMessage with extra field...")
         message = ChatMessage(role="user", content="Hello", custom_field="value")
         
-        print(f"Comparing custom_field: Got '{message.custom_field}'")
-        assert message.custom_field == "value"
+        print(f"Comparing model_extra: Expected None, Got {message.model_extra}")
+        assert message.model_extra is None
+        assert not hasattr(message, "custom_field")
+        assert "custom_field" not in message.model_dump()
 
 
 # ==================================================================================================
@@ -819,6 +819,67 @@ class TestAwsEventStreamParserFinalizeToolCall:
         
         print(f"current_tool_call after finalization: {aws_event_parser.current_tool_call}")
         assert aws_event_parser.current_tool_call is None
+    
+    def test_finalize_debug_log_truncates_large_arguments(self, aws_event_parser):
+        """
+        What it does: Tests that the lazy debug log still renders truncated raw arguments.
+        Goal: Ensure large arguments are logged as a 200-char prefix, not in full.
+        """
+        from loguru import logger
+        
+        print("Setup: Tool call with large arguments and a DEBUG sink...")
+        large_args = '{"content": "' + "x" * 100000 + '"}'
+        aws_event_parser.current_tool_call = {
+            "id": "call_7",
+            "type": "function",
+            "function": {
+                "name": "write_file",
+                "arguments": large_args
+            }
+        }
+        messages = []
+        sink_id = logger.add(messages.append, level="DEBUG", format="{message}")
+        
+        try:
+            print("Action: Finalizing tool call...")
+            aws_event_parser._finalize_tool_call()
+        finally:
+            logger.remove(sink_id)
+        
+        finalize_logs = [m for m in messages if "Finalizing tool call" in m]
+        print(f"Captured: {[m[:80] for m in finalize_logs]}")
+        assert len(finalize_logs) == 1
+        assert "'write_file'" in finalize_logs[0]
+        assert len(finalize_logs[0]) < 400
+    
+    def test_finalize_debug_log_lists_dict_argument_keys(self, aws_event_parser):
+        """
+        What it does: Tests that the lazy debug log for dict arguments renders the keys.
+        Goal: Ensure deferred formatting still produces the same message when DEBUG is on.
+        """
+        from loguru import logger
+        
+        print("Setup: Tool call with dict arguments and a DEBUG sink...")
+        aws_event_parser.current_tool_call = {
+            "id": "call_8",
+            "type": "function",
+            "function": {
+                "name": "read_file",
+                "arguments": {"path": "/tmp/a", "limit": 10}
+            }
+        }
+        messages = []
+        sink_id = logger.add(messages.append, level="DEBUG", format="{message}")
+        
+        try:
+            print("Action: Finalizing tool call...")
+            aws_event_parser._finalize_tool_call()
+        finally:
+            logger.remove(sink_id)
+        
+        dict_logs = [m for m in messages if "already dict" in m]
+        print(f"Captured: {dict_logs}")
+        assert dict_logs == ["Tool 'read_file' arguments already dict with keys: ['path', 'limit']\n"]
 
 
 class TestAwsEventStreamParserEdgeCases:
@@ -135,6 +135,36 @@ class TestVerifyAnthropicApiKey:
         print(f"Checking: HTTPException with status 401...")
         assert exc_info.value.status_code == 401
     
+    @pytest.mark.asyncio
+    async def test_non_ascii_x_api_key_raises_401(self):
+        """
+        What it does: Verifies that a non-ASCII x-api-key is rejected cleanly.
+        Purpose: Ensure the constant-time comparison never fails with TypeError (500).
+        """
+        print("Action: Calling verify_anthropic_api_key with non-ASCII key...")
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_anthropic_api_key(x_api_key="ключ-é", authorization="Bearer ключ-é")
+        
+        print(f"Checking: HTTPException with status 401...")
+        assert exc_info.value.status_code == 401
+    
+    @pytest.mark.asyncio
+    async def test_empty_configured_key_rejects_empty_credentials(self):
+        """
+        What it does: Verifies that empty credentials are rejected when PROXY_API_KEY is empty.
+        Purpose: Ensure a misconfigured empty key does not open the gateway.
+        """
+        print("Setup: Empty PROXY_API_KEY...")
+        with patch("kiro.routes_anthropic.PROXY_API_KEY", ""), \
+             patch("kiro.routes_anthropic._EXPECTED_API_KEY", b""), \
+             patch("kiro.routes_anthropic._EXPECTED_AUTH_HEADER", b"Bearer "):
+            print("Action: Calling verify_anthropic_api_key with empty Bearer token...")
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_anthropic_api_key(x_api_key=None, authorization="Bearer ")
+        
+        print(f"Checking: HTTPException with status 401...")
+        assert exc_info.value.status_code == 401
+    
     @pytest.mark.asyncio
     async def test_error_response_format_is_anthropic_style(self):
         """
@@ -237,6 +267,37 @@ class TestMessagesAuthentication:
         
         print(f"Status: {response.status_code}")
         assert response.status_code == 401
+    
+    def test_messages_rejects_and_logs_when_proxy_key_empty(self, test_client):
+        """
+        What it does: Verifies an empty PROXY_API_KEY rejects requests and logs why.
+        Purpose: Ensure the operator sees an actionable error, not just a bare 401.
+        """
+        from loguru import logger
+        
+        print("Setup: Empty PROXY_API_KEY and an ERROR sink...")
+        messages = []
+        sink_id = logger.add(messages.append, level="ERROR", format="{message}")
+        try:
+            with patch("kiro.routes_anthropic.PROXY_API_KEY", ""), \
+                 patch("kiro.routes_anthropic._EXPECTED_API_KEY", b""), \
+                 patch("kiro.routes_anthropic._EXPECTED_AUTH_HEADER", b"Bearer "):
+                print("Action: POST /v1/messages with empty x-api-key and Bearer token...")
+                response = test_client.post(
+                    "/v1/messages",
+                    headers={"x-api-key": "", "Authorization": "Bearer "},
+                    json={
+                        "model": "claude-sonnet-4-5",
+                        "max_tokens": 1024,
+                        "messages": [{"role": "user", "content": "Hello"}]
+                    }
+                )
+        finally:
+            logger.remove(sink_id)
+        
+        print(f"Status: {response.status_code}, errors: {messages}")
+        assert response.status_code == 401
+        assert any("PROXY_API_KEY is empty" in m for m in messages)
 
 
 # =============================================================================
@@ -1588,4 +1649,33 @@ class TestContentTruncationRecovery:
         
         print("Checking: Message unchanged...")
         text = self._get_block_value(modified_messages[0].content[0], "text")
-        assert text == "This is a complete response."
\ No newline at end of file
+        assert text == "This is a complete response."
+
+
+# =============================================================================
+# Tests for tokenizer list dumper
+# =============================================================================
+
+class TestTokenizerDumper:
+    """Tests for the whole-list dumper that feeds token counting."""
+    
+    def test_messages_dump_matches_per_message_model_dump(self):
+        """
+        What it does: Compares _MESSAGES_DUMPER output with per-message model_dump().
+        Purpose: Ensure the tokenizer receives the same dicts as before.
+        """
+        from kiro.routes_anthropic import _MESSAGES_DUMPER
+        from kiro.models_anthropic import AnthropicMessage
+        
+        print("Setup: Creating string and block content messages...")
+        messages = [
+            AnthropicMessage(role="user", content="Hello"),
+            AnthropicMessage(role="assistant", content=[{"type": "text", "text": "Hi"}]),
+            AnthropicMessage(role="user", content=[{"type": "tool_result", "tool_use_id": "toolu_1", "content": "ok"}]),
+        ]
+        
+        print("Action: Dumping list...")
+        dumped = _MESSAGES_DUMPER.dump_python(messages)
+        
+        print(f"Comparing: {dumped}")
+        assert dumped == [msg.model_dump() for msg in messages]
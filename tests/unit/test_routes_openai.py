@@ -141,6 +141,53 @@ class TestVerifyApiKey:
         
         print(f"Checking: HTTPException with status 401...")
         assert exc_info.value.status_code == 401
+    
+    @pytest.mark.asyncio
+    async def test_key_with_trailing_suffix_raises_401(self):
+        """
+        What it does: Verifies that a valid key followed by extra characters is rejected.
+        Purpose: Ensure the precomputed header is compared exactly, not by prefix.
+        """
+        print("Setup: Valid Bearer token with suffix...")
+        suffixed = f"Bearer {PROXY_API_KEY}x"
+        
+        print("Action: Calling verify_api_key...")
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_key(suffixed)
+        
+        print(f"Checking: HTTPException with status 401...")
+        assert exc_info.value.status_code == 401
+    
+    @pytest.mark.asyncio
+    async def test_non_ascii_key_raises_401(self):
+        """
+        What it does: Verifies that a header with non-ASCII characters is rejected cleanly.
+        Purpose: Ensure the constant-time comparison never fails with TypeError (500).
+        """
+        print("Setup: Bearer token with non-ASCII characters...")
+        
+        print("Action: Calling verify_api_key...")
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_key("Bearer ключ-é")
+        
+        print(f"Checking: HTTPException with status 401...")
+        assert exc_info.value.status_code == 401
+    
+    @pytest.mark.asyncio
+    async def test_empty_configured_key_rejects_empty_bearer(self):
+        """
+        What it does: Verifies that "Bearer " is rejected when PROXY_API_KEY is empty.
+        Purpose: Ensure a misconfigured empty key does not open the gateway.
+        """
+        print("Setup: Empty PROXY_API_KEY...")
+        with patch("kiro.routes_openai.PROXY_API_KEY", ""), \
+             patch("kiro.routes_openai._EXPECTED_AUTH_HEADER", b"Bearer "):
+            print("Action: Calling verify_api_key with empty Bearer token...")
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_api_key("Bearer ")
+        
+        print(f"Checking: HTTPException with status 401...")
+        assert exc_info.value.status_code == 401
 
 
 # =============================================================================
@@ -255,6 +302,35 @@ class TestHealthEndpoint:
         
         print(f"Status: {response.status_code}")
         assert response.status_code == 200
+    
+    def test_health_timestamp_does_not_leak_into_static_fields(self, test_client):
+        """
+        What it does: Verifies repeated health calls keep the prebuilt fields untouched.
+        Purpose: Ensure the per-request timestamp is not written into the shared dict.
+        """
+        from kiro.routes_openai import _HEALTH_STATIC_FIELDS
+        
+        print("Action: GET /health twice...")
+        first = test_client.get("/health").json()
+        second = test_client.get("/health").json()
+        
+        print(f"Results: {first}, {second}")
+        assert set(first) == {"status", "timestamp", "version"}
+        assert set(second) == {"status", "timestamp", "version"}
+        assert "timestamp" not in _HEALTH_STATIC_FIELDS
+    
+    def test_health_timestamp_is_utc_iso8601(self, test_client):
+        """
+        What it does: Verifies the health timestamp parses as a timezone-aware UTC datetime.
+        Purpose: Ensure the strftime-based timestamp stays ISO 8601 compatible.
+        """
+        print("Action: GET /health...")
+        timestamp = test_client.get("/health").json()["timestamp"]
+        
+        print(f"Timestamp: {timestamp}")
+        parsed = datetime.fromisoformat(timestamp)
+        assert parsed.utcoffset().total_seconds() == 0
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 60
 
 
 # =============================================================================
@@ -378,6 +454,66 @@ class TestModelsEndpoint:
         
         for model in response.json()["data"]:
             assert model["owned_by"] == "anthropic"
+    
+    def test_models_response_is_reused_until_cache_changes(self, test_client, valid_proxy_api_key):
+        """
+        What it does: Verifies the serialized model list is cached and rebuilt on cache updates.
+        Purpose: Ensure repeated /v1/models polling is cheap but never serves stale models.
+        """
+        headers = {"Authorization": f"Bearer {valid_proxy_api_key}"}
+        state = test_client.app.state
+        
+        print("Action: First GET /v1/models...")
+        first = test_client.get("/v1/models", headers=headers)
+        cached = state.models_response
+        
+        print("Action: Second GET /v1/models...")
+        second = test_client.get("/v1/models", headers=headers)
+        
+        print(f"Cached version: {cached[0]}")
+        assert first.status_code == 200
+        assert second.content == first.content
+        assert state.models_response is cached
+        
+        print("Action: Adding a model to the cache and fetching again...")
+        state.model_resolver.cache.add_hidden_model("claude-test-9.9", "CLAUDE_TEST_9_9")
+        third = test_client.get("/v1/models", headers=headers)
+        
+        model_ids = [m["id"] for m in third.json()["data"]]
+        print(f"Model IDs: {model_ids}")
+        assert "claude-test-9.9" in model_ids
+        assert state.models_response is not cached
+    
+    def test_models_share_one_created_timestamp(self, test_client, valid_proxy_api_key):
+        """
+        What it does: Verifies all models carry the same "created" value, close to now.
+        Purpose: Ensure one timestamp is taken per list build instead of one per model.
+        
+        The serialized list is cached on app.state (see the reuse test above), so
+        "created" keeps the value from the last build until the model cache version
+        changes - repeated calls return the same timestamp.
+        """
+        import time
+        
+        headers = {"Authorization": f"Bearer {valid_proxy_api_key}"}
+        state = test_client.app.state
+        state.models_response = None  # Force a fresh build for this test
+        
+        print("Action: GET /v1/models...")
+        before = int(time.time())
+        response = test_client.get("/v1/models", headers=headers)
+        after = int(time.time())
+        
+        created_values = {m["created"] for m in response.json()["data"]}
+        print(f"Created values: {created_values}, window: {before}..{after}")
+        assert response.status_code == 200
+        assert len(response.json()["data"]) > 1
+        assert len(created_values) == 1
+        assert before <= created_values.pop() <= after
+        
+        print("Action: Second GET /v1/models (served from the bytes cache)...")
+        again = test_client.get("/v1/models", headers=headers)
+        assert again.json()["data"][0]["created"] == response.json()["data"][0]["created"]
 
 
 # =============================================================================
@@ -421,6 +557,35 @@ class TestChatCompletionsAuthentication:
         
         print(f"Status: {response.status_code}")
         assert response.status_code == 401
+    
+    def test_chat_completions_rejects_and_logs_when_proxy_key_empty(self, test_client):
+        """
+        What it does: Verifies an empty PROXY_API_KEY rejects requests and logs why.
+        Purpose: Ensure the operator sees an actionable error, not just a bare 401.
+        """
+        from loguru import logger
+        
+        print("Setup: Empty PROXY_API_KEY and an ERROR sink...")
+        messages = []
+        sink_id = logger.add(messages.append, level="ERROR", format="{message}")
+        try:
+            with patch("kiro.routes_openai.PROXY_API_KEY", ""), \
+                 patch("kiro.routes_openai._EXPECTED_AUTH_HEADER", b"Bearer "):
+                print("Action: POST /v1/chat/completions with empty Bearer token...")
+                response = test_client.post(
+                    "/v1/chat/completions",
+                    headers={"Authorization": "Bearer "},
+                    json={
+                        "model": "claude-sonnet-4-5",
+                        "messages": [{"role": "user", "content": "Hello"}]
+                    }
+                )
+        finally:
+            logger.remove(sink_id)
+        
+        print(f"Status: {response.status_code}, errors: {messages}")
+        assert response.status_code == 401
+        assert any("PROXY_API_KEY is empty" in m for m in messages)
 
 
 class TestChatCompletionsValidation:
@@ -976,6 +1141,77 @@ class TestHTTPClientSelection:
         assert call_args[1]['shared_client'] is not None, \
             "Non-streaming should use shared client"
         print("✅ Non-streaming correctly uses shared client")
+    
+    @patch('kiro.routes_openai.KiroHttpClient')
+    def test_client_closed_once_on_kiro_error_status(
+        self,
+        mock_kiro_http_client_class,
+        test_client,
+        valid_proxy_api_key
+    ):
+        """
+        What it does: Verifies the HTTP client is closed exactly once when Kiro returns an error.
+        Purpose: Ensure the centralized cleanup does not skip or double-close the client.
+        """
+        print("\n--- Test: Client closed once on Kiro error status ---")
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.aread = AsyncMock(return_value=b'{"message": "Bad request"}')
+        mock_client_instance = AsyncMock()
+        mock_client_instance.request_with_retry = AsyncMock(return_value=mock_response)
+        mock_client_instance.close = AsyncMock()
+        mock_kiro_http_client_class.return_value = mock_client_instance
+        
+        print("Action: POST with stream=false...")
+        response = test_client.post(
+            "/v1/chat/completions",
+            headers={"Authorization": f"Bearer {valid_proxy_api_key}"},
+            json={
+                "model": "claude-sonnet-4-5",
+                "messages": [{"role": "user", "content": "Hello"}],
+                "stream": False
+            }
+        )
+        
+        print(f"Status: {response.status_code}, close calls: {mock_client_instance.close.await_count}")
+        assert response.status_code == 400
+        assert mock_client_instance.close.await_count == 1
+    
+    @patch('kiro.routes_openai.KiroHttpClient')
+    def test_client_closed_once_on_request_exception(
+        self,
+        mock_kiro_http_client_class,
+        test_client,
+        valid_proxy_api_key
+    ):
+        """
+        What it does: Verifies the HTTP client is closed exactly once when the request raises.
+        Purpose: Ensure the finally-based cleanup covers the exception path.
+        """
+        print("\n--- Test: Client closed once on request exception ---")
+        
+        mock_client_instance = AsyncMock()
+        mock_client_instance.request_with_retry = AsyncMock(
+            side_effect=Exception("Network blocked")
+        )
+        mock_client_instance.close = AsyncMock()
+        mock_kiro_http_client_class.return_value = mock_client_instance
+        
+        print("Action: POST with stream=true...")
+        response = test_client.post(
+            "/v1/chat/completions",
+            headers={"Authorization": f"Bearer {valid_proxy_api_key}"},
+            json={
+                "model": "claude-sonnet-4-5",
+                "messages": [{"role": "user", "content": "Hello"}],
+                "stream": True
+            }
+        )
+        
+        print(f"Status: {response.status_code}, close calls: {mock_client_instance.close.await_count}")
+        assert response.status_code == 500
+        assert mock_client_instance.close.await_count == 1
 
 
 # =============================================================================
@@ -1396,4 +1632,50 @@ class TestContentTruncationRecovery:
         
         print("Checking: Match found...")
         assert info is not None
-        assert info.message_hash == hash1
\ No newline at end of file
+        assert info.message_hash == hash1
+
+
+# =============================================================================
+# Tests for tokenizer list dumpers
+# =============================================================================
+
+class TestTokenizerDumpers:
+    """Tests for the whole-list dumpers that feed fallback token counting."""
+    
+    def test_messages_dump_matches_per_message_model_dump(self):
+        """
+        What it does: Compares _MESSAGES_DUMPER output with per-message model_dump().
+        Purpose: Ensure the tokenizer receives the same dicts as before.
+        """
+        from kiro.routes_openai import _MESSAGES_DUMPER
+        from kiro.models_openai import ChatMessage
+        
+        print("Setup: Creating mixed messages (including a model_copy)...")
+        messages = [
+            ChatMessage(role="system", content="Be brief"),
+            ChatMessage(role="user", content=[{"type": "text", "text": "Hi"}]),
+            ChatMessage(role="assistant", content=None, tool_calls=[{"id": "call_1", "type": "function", "function": {"name": "f", "arguments": "{}"}}]),
+        ]
+        messages.append(ChatMessage(role="tool", content="ok", tool_call_id="call_1").model_copy(update={"content": "modified"}))
+        
+        print("Action: Dumping list...")
+        dumped = _MESSAGES_DUMPER.dump_python(messages)
+        
+        print(f"Comparing: {dumped}")
+        assert dumped == [msg.model_dump() for msg in messages]
+    
+    def test_tools_dump_matches_per_tool_model_dump(self):
+        """
+        What it does: Compares _TOOLS_DUMPER output with per-tool model_dump().
+        Purpose: Ensure tool token counting input is unchanged.
+        """
+        from kiro.routes_openai import _TOOLS_DUMPER
+        from kiro.models_openai import Tool
+        
+        tools = [Tool(type="function", function={"name": "get_weather", "parameters": {"type": "object"}})]
+        
+        print("Action: Dumping tools...")
+        dumped = _TOOLS_DUMPER.dump_python(tools)
+        
+        print(f"Comparing: {dumped}")
+        assert dumped == [tool.model_dump() for tool in tools]
@@ -22,6 +22,7 @@ from kiro.streaming_openai import (
     stream_with_first_token_retry,
     collect_stream_response,
     FirstTokenTimeoutError,
+    _build_delta_chunk_template,
 )
 from kiro.streaming_core import KiroEvent
 
@@ -387,6 +388,111 @@ class TestStreamKiroToOpenai:
         print("✓ Response closed on error")
 
 
+# ==================================================================================================
+# Tests for _build_delta_chunk_template
+# ==================================================================================================
+
+class TestBuildDeltaChunkTemplate:
+    """Tests for the pre-rendered per-token chunk template."""
+    
+    @pytest.mark.parametrize("text", [
+        "Hello",
+        'quotes " and \\ backslashes',
+        "line\nbreaks\tand tabs",
+        "Привет, 世界 🎉",
+        "__kiro_gateway_delta__",
+        "",
+    ])
+    def test_matches_full_json_dumps(self, text):
+        """
+        What it does: Compares template output with json.dumps of the full chunk dict.
+        Goal: Ensure the fast path is byte-identical to the original serialization.
+        """
+        print(f"Setup: Template for delta text {text!r}...")
+        prefix, suffix = _build_delta_chunk_template("chatcmpl-abc", 1700000000, "claude-sonnet-4", "content")
+        
+        expected_chunk = {
+            "id": "chatcmpl-abc",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "claude-sonnet-4",
+            "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}]
+        }
+        expected = f"data: {json.dumps(expected_chunk, ensure_ascii=False)}\n\n"
+        actual = prefix + json.dumps(text, ensure_ascii=False) + suffix
+        
+        print(f"Comparing: Expected {expected!r}, Got {actual!r}")
+        assert actual == expected
+    
+    def test_reasoning_content_key(self):
+        """
+        What it does: Builds a template for the reasoning_content delta field.
+        Goal: Ensure the delta key is configurable.
+        """
+        prefix, suffix = _build_delta_chunk_template("chatcmpl-abc", 1, "m", "reasoning_content")
+        
+        chunk = json.loads((prefix + '"thought"' + suffix)[len("data: "):])
+        print(f"Parsed chunk: {chunk}")
+        assert chunk["choices"][0]["delta"] == {"reasoning_content": "thought"}
+    
+    @pytest.mark.asyncio
+    async def test_stream_chunks_share_header_and_parse(self, mock_http_client, mock_response, mock_model_cache, mock_auth_manager):
+        """
+        What it does: Streams several content events and parses every chunk.
+        Goal: Ensure templated chunks are valid JSON with the same id/created as the first chunk.
+        """
+        print("Setup: Mock stream with several content events...")
+        
+        async def mock_parse_kiro_stream(*args, **kwargs):
+            yield KiroEvent(type="content", content="First")
+            yield KiroEvent(type="content", content='He said "hi"\n')
+            yield KiroEvent(type="content", content="Ünïcödé")
+        
+        chunks = []
+        with patch('kiro.streaming_openai.parse_kiro_stream', mock_parse_kiro_stream):
+            with patch('kiro.streaming_openai.parse_bracket_tool_calls', return_value=[]):
+                async for chunk in stream_kiro_to_openai(
+                    mock_http_client, mock_response, "claude-sonnet-4",
+                    mock_model_cache, mock_auth_manager
+                ):
+                    chunks.append(chunk)
+        
+        content_chunks = [json.loads(c[len("data: "):]) for c in chunks[:3]]
+        print(f"Content chunks: {content_chunks}")
+        assert content_chunks[0]["choices"][0]["delta"] == {"content": "First", "role": "assistant"}
+        assert content_chunks[1]["choices"][0]["delta"] == {"content": 'He said "hi"\n'}
+        assert content_chunks[2]["choices"][0]["delta"] == {"content": "Ünïcödé"}
+        assert {c["id"] for c in content_chunks} == {content_chunks[0]["id"]}
+        assert {c["created"] for c in content_chunks} == {content_chunks[0]["created"]}
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled,expected_calls", [(False, 0), (True, 2)])
+    async def test_modified_chunks_logged_only_when_debug_enabled(self, enabled, expected_calls, mock_http_client, mock_response, mock_model_cache, mock_auth_manager):
+        """
+        What it does: Checks log_modified_chunk() is called only when debug logging is enabled.
+        Goal: Ensure per-token encode for debug logs is skipped in DEBUG_MODE=off.
+        """
+        print(f"Setup: debug_logger.is_enabled() -> {enabled}...")
+        mock_debug_logger = MagicMock()
+        mock_debug_logger.is_enabled.return_value = enabled
+        
+        async def mock_parse_kiro_stream(*args, **kwargs):
+            yield KiroEvent(type="content", content="One")
+            yield KiroEvent(type="content", content="Two")
+        
+        with patch('kiro.streaming_openai.debug_logger', mock_debug_logger):
+            with patch('kiro.streaming_openai.parse_kiro_stream', mock_parse_kiro_stream):
+                with patch('kiro.streaming_openai.parse_bracket_tool_calls', return_value=[]):
+                    async for _ in stream_kiro_to_openai(
+                        mock_http_client, mock_response, "claude-sonnet-4",
+                        mock_model_cache, mock_auth_manager
+                    ):
+                        pass
+        
+        print(f"log_modified_chunk calls: {mock_debug_logger.log_modified_chunk.call_count}")
+        assert mock_debug_logger.log_modified_chunk.call_count == expected_calls
+
+
 # ==================================================================================================
 # Tests for thinking content handling
 # ==================================================================================================
@@ -896,6 +1002,34 @@ class TestCollectStreamResponse:
         assert message["reasoning_content"] == "Let me think..."
         print("✓ Reasoning content collected correctly")
     
+    @pytest.mark.asyncio
+    async def test_collects_many_unicode_chunks_in_order(self, mock_http_client, mock_response, mock_model_cache, mock_auth_manager):
+        """
+        What it does: Collects many non-ASCII content chunks from stream.
+        Goal: Verify joined content matches the streamed parts exactly and in order.
+        """
+        print("Setup: Mock stream with 500 unicode chunks...")
+        parts = [f"Привет {i} 👋 \"q\"\n" for i in range(500)]
+        
+        async def mock_parse_kiro_stream(*args, **kwargs):
+            for part in parts:
+                yield KiroEvent(type="content", content=part)
+        
+        print("Action: Collecting stream response...")
+        
+        with patch('kiro.streaming_openai.parse_kiro_stream', mock_parse_kiro_stream):
+            with patch('kiro.streaming_openai.parse_bracket_tool_calls', return_value=[]):
+                result = await collect_stream_response(
+                    mock_http_client, mock_response, "claude-sonnet-4",
+                    mock_model_cache, mock_auth_manager
+                )
+        
+        content = result["choices"][0]["message"]["content"]
+        print(f"Result length: {len(content)}")
+        
+        assert content == "".join(parts)
+        print("✓ Content joined correctly")
+    
     @pytest.mark.asyncio
     async def test_collects_tool_calls(self, mock_http_client, mock_response, mock_model_cache, mock_auth_manager):
         """
@@ -8,6 +8,7 @@ Tests cover:
 - Content truncation save/retrieve operations
 - One-time retrieval pattern
 - Thread safety
+- Size cap with oldest-first eviction
 - Cache statistics
 """
 
@@ -23,6 +24,8 @@ from kiro.truncation_state import (
     save_content_truncation,
     get_content_truncation,
     get_cache_stats,
+    has_pending_truncations,
+    MAX_CACHE_ENTRIES,
     ToolTruncationInfo,
     ContentTruncationInfo,
     _tool_truncation_cache,
@@ -366,6 +369,138 @@ class TestThreadSafety:
         print("✅ Test passed: Thread-safe content operations")
 
 
+class TestHasPendingTruncations:
+    """Test suite for the has_pending_truncations() fast-path check."""
+    
+    def test_false_when_empty(self):
+        """
+        Test Case: No pending truncations
+        
+        What it does: Verify has_pending_truncations() is False for empty caches
+        Goal: Ensure request handlers can skip the recovery scan
+        """
+        print("\n=== Test: has_pending_truncations (empty) ===")
+        
+        assert has_pending_truncations() is False
+        
+        print("✅ Test passed: Empty caches report nothing pending")
+    
+    def test_tracks_tool_truncation_lifecycle(self):
+        """
+        Test Case: Tool truncation saved and consumed
+        
+        What it does: Verify the flag follows save/get of a tool truncation
+        Goal: Ensure the scan runs exactly while info is waiting
+        """
+        print("\n=== Test: has_pending_truncations (tool) ===")
+        
+        save_tool_truncation("call_1", "Write", {})
+        assert has_pending_truncations() is True
+        
+        get_tool_truncation("call_1")
+        assert has_pending_truncations() is False
+        
+        print("✅ Test passed: Flag follows tool truncation lifecycle")
+    
+    def test_tracks_content_truncation_lifecycle(self):
+        """
+        Test Case: Content truncation saved and consumed
+        
+        What it does: Verify the flag follows save/get of a content truncation
+        Goal: Ensure content-only truncations also trigger the scan
+        """
+        print("\n=== Test: has_pending_truncations (content) ===")
+        
+        save_content_truncation("truncated text")
+        assert has_pending_truncations() is True
+        
+        get_content_truncation("truncated text")
+        assert has_pending_truncations() is False
+        
+        print("✅ Test passed: Flag follows content truncation lifecycle")
+
+
+class TestCacheEviction:
+    """Test suite for the MAX_CACHE_ENTRIES size cap."""
+    
+    def test_tool_cache_evicts_oldest_entry(self):
+        """
+        Test Case: Tool cache over the limit
+        
+        What it does: Verify saving past MAX_CACHE_ENTRIES drops the oldest tool truncation
+        Goal: Ensure abandoned truncations cannot grow the cache without bound
+        """
+        print("\n=== Test: Tool cache eviction ===")
+        
+        for i in range(MAX_CACHE_ENTRIES + 1):
+            save_tool_truncation(f"call_{i}", "Write", {})
+        print(f"Cache size: {len(_tool_truncation_cache)}")
+        
+        assert len(_tool_truncation_cache) == MAX_CACHE_ENTRIES
+        assert get_tool_truncation("call_0") is None, "Oldest entry should be evicted"
+        assert get_tool_truncation(f"call_{MAX_CACHE_ENTRIES}") is not None, "Newest entry should be kept"
+        
+        print("✅ Test passed: Oldest tool truncation evicted")
+    
+    def test_content_cache_evicts_oldest_entry(self):
+        """
+        Test Case: Content cache over the limit
+        
+        What it does: Verify saving past MAX_CACHE_ENTRIES drops the oldest content truncation
+        Goal: Ensure both caches share the same bound
+        """
+        print("\n=== Test: Content cache eviction ===")
+        
+        for i in range(MAX_CACHE_ENTRIES + 1):
+            save_content_truncation(f"truncated content {i}")
+        print(f"Cache size: {len(_content_truncation_cache)}")
+        
+        assert len(_content_truncation_cache) == MAX_CACHE_ENTRIES
+        assert get_content_truncation("truncated content 0") is None, "Oldest entry should be evicted"
+        assert get_content_truncation(f"truncated content {MAX_CACHE_ENTRIES}") is not None
+        
+        print("✅ Test passed: Oldest content truncation evicted")
+    
+    def test_recovery_works_for_entries_saved_after_eviction(self):
+        """
+        Test Case: Recovery right after the cap evicted older entries
+        
+        What it does: Verify a truncation saved after eviction, and the oldest surviving one,
+        are still retrieved and produce a recovery tool result
+        Goal: Ensure eviction only drops the oldest entries and never breaks recovery
+        """
+        from kiro.truncation_recovery import generate_truncation_tool_result
+        
+        print("\n=== Test: Recovery after eviction ===")
+        
+        for i in range(MAX_CACHE_ENTRIES + 5):
+            save_tool_truncation(f"call_{i}", "Write", {})
+            save_content_truncation(f"truncated content {i}")
+        save_tool_truncation("call_latest", "Bash", {"size_bytes": 5000, "reason": "missing closing brace"})
+        save_content_truncation("latest truncated content")
+        print(f"Tool cache size: {len(_tool_truncation_cache)}, content cache size: {len(_content_truncation_cache)}")
+        
+        assert len(_tool_truncation_cache) == MAX_CACHE_ENTRIES
+        assert len(_content_truncation_cache) == MAX_CACHE_ENTRIES
+        
+        latest = get_tool_truncation("call_latest")
+        assert latest is not None, "Entry saved right after eviction should be kept"
+        result = generate_truncation_tool_result(latest.tool_name, latest.tool_call_id, latest.truncation_info)
+        print(f"Recovery tool result: {result}")
+        assert result["tool_use_id"] == "call_latest"
+        assert result["is_error"] is True
+        
+        oldest_kept = get_tool_truncation("call_6")
+        assert oldest_kept is not None, "Oldest entry within the cap should be kept"
+        assert get_tool_truncation("call_5") is None, "Entry just past the cap should be evicted"
+        
+        assert get_content_truncation("latest truncated content") is not None
+        assert get_content_truncation("truncated content 6") is not None
+        assert get_content_truncation("truncated content 5") is None
+        
+        print("✅ Test passed: Recovery works after eviction")
+
+
 class TestCacheStats:
     """Test suite for cache statistics."""
     
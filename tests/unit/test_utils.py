@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for utils.py - Common helper utilities.
+
+Tests cover:
+- JSON parsing with optional orjson acceleration and stdlib fallback
+- Pretty JSON serialization for debug dumps
+- Kiro request header construction
+- Completion and tool call ID generation
+- Stable conversation ID generation
+"""
+
+import json
+import re
+from unittest.mock import Mock, patch
+
+import pytest
+
+from kiro import utils
+from kiro.utils import (
+    generate_completion_id,
+    generate_conversation_id,
+    generate_tool_call_id,
+    get_kiro_headers,
+    json_dumps_pretty,
+    json_loads,
+)
+
+
+# ==================================================================================================
+# Tests for json_loads
+# ==================================================================================================
+
+class TestJsonLoads:
+    """Tests for json_loads function."""
+    
+    def test_parses_str_input(self):
+        """
+        What it does: Verifies that a JSON string is parsed.
+        Purpose: Ensure the helper is a drop-in replacement for json.loads.
+        """
+        print("Action: Parsing JSON string...")
+        result = json_loads('{"content": "Hello", "n": 1}')
+        
+        print(f"Result: {result}")
+        assert result == {"content": "Hello", "n": 1}
+    
+    def test_parses_bytes_input(self):
+        """
+        What it does: Verifies that raw bytes are parsed without manual decode.
+        Purpose: Ensure httpx response.content can be passed directly.
+        """
+        print("Action: Parsing JSON bytes...")
+        result = json_loads('{"text": "Привет 👋"}'.encode("utf-8"))
+        
+        print(f"Result: {result}")
+        assert result == {"text": "Привет 👋"}
+    
+    def test_big_integer_falls_back_to_stdlib(self):
+        """
+        What it does: Verifies that integers above 64 bits are still parsed.
+        Purpose: Ensure orjson limitations do not change behavior vs json.loads.
+        """
+        big = 2 ** 70
+        print(f"Action: Parsing integer {big}...")
+        result = json_loads(f'{{"value": {big}}}')
+        
+        print(f"Result: {result}")
+        assert result == {"value": big}
+    
+    def test_invalid_json_raises_json_decode_error(self):
+        """
+        What it does: Verifies that invalid JSON raises json.JSONDecodeError.
+        Purpose: Ensure existing `except json.JSONDecodeError` handlers keep working.
+        """
+        print("Action: Parsing invalid JSON...")
+        with pytest.raises(json.JSONDecodeError):
+            json_loads('{"content": ')
+    
+    def test_works_without_orjson(self):
+        """
+        What it does: Verifies that parsing works when orjson is not installed.
+        Purpose: Ensure orjson stays an optional dependency.
+        """
+        print("Setup: Simulating missing orjson...")
+        with patch.object(utils, "orjson", None):
+            result = json_loads('{"a": [1, 2, 3]}')
+            
+            print(f"Result: {result}")
+            assert result == {"a": [1, 2, 3]}
+            
+            with pytest.raises(json.JSONDecodeError):
+                json_loads("not json")
+
+
+# ==================================================================================================
+# Tests for json_dumps_pretty
+# ==================================================================================================
+
+class TestJsonDumpsPretty:
+    """Tests for json_dumps_pretty() debug serializer."""
+    
+    def test_matches_stdlib_layout(self):
+        """
+        What it does: Compares output with json.dumps(indent=2, ensure_ascii=False).
+        Purpose: Ensure debug dump files look the same with or without orjson.
+        """
+        data = {"conversationState": {"history": [{"userInputMessage": {"content": "Привет"}}], "empty": {}, "list": []}}
+        expected = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        
+        print("Action: Serializing nested payload...")
+        result = json_dumps_pretty(data)
+        
+        print(f"Result: {result!r}")
+        assert isinstance(result, bytes)
+        assert result == expected
+    
+    def test_big_int_falls_back_to_stdlib(self):
+        """
+        What it does: Verifies that integers beyond 64 bits are still serialized.
+        Purpose: Ensure orjson rejections fall back to stdlib json.
+        """
+        big = 2 ** 70
+        
+        print("Action: Serializing big integer...")
+        result = json_dumps_pretty({"value": big})
+        
+        print(f"Result: {result!r}")
+        assert json.loads(result) == {"value": big}
+    
+    def test_works_without_orjson(self):
+        """
+        What it does: Verifies serialization when orjson is not installed.
+        Purpose: Ensure orjson stays an optional dependency.
+        """
+        print("Setup: Simulating missing orjson...")
+        with patch.object(utils, "orjson", None):
+            result = json_dumps_pretty({"a": "ü"})
+        
+        print(f"Result: {result!r}")
+        assert result == '{\n  "a": "ü"\n}'.encode("utf-8")
+
+
+# ==================================================================================================
+# Tests for get_kiro_headers
+# ==================================================================================================
+
+class TestGetKiroHeaders:
+    """Tests for get_kiro_headers()."""
+    
+    def test_user_agents_include_fingerprint(self):
+        """
+        What it does: Verifies both user agent headers end with the auth manager fingerprint.
+        Purpose: Ensure precomputed user agents match the previous per-call format.
+        """
+        auth_manager = Mock()
+        auth_manager.fingerprint = "abc123"
+        
+        print("Action: Building headers...")
+        headers = get_kiro_headers(auth_manager, "token-1")
+        
+        print(f"Result: {headers}")
+        assert headers["Authorization"] == "Bearer token-1"
+        assert headers["User-Agent"].startswith("aws-sdk-js/1.0.27 ua/2.1 ")
+        assert headers["User-Agent"].endswith("KiroIDE-0.7.45-abc123")
+        assert headers["x-amz-user-agent"] == "aws-sdk-js/1.0.27 KiroIDE-0.7.45-abc123"
+    
+    def test_returns_fresh_dict_per_call(self):
+        """
+        What it does: Verifies each call returns a new dict with a new invocation ID.
+        Purpose: Ensure callers can add headers (e.g. Connection: close) without affecting later requests.
+        """
+        auth_manager = Mock()
+        auth_manager.fingerprint = "abc123"
+        
+        print("Action: Building headers twice and mutating the first...")
+        first = get_kiro_headers(auth_manager, "token-1")
+        first["Connection"] = "close"
+        second = get_kiro_headers(auth_manager, "token-2")
+        
+        print(f"Second: {second}")
+        assert "Connection" not in second
+        assert second["Authorization"] == "Bearer token-2"
+        assert first["amz-sdk-invocation-id"] != second["amz-sdk-invocation-id"]
+
+
+# ==================================================================================================
+# Tests for ID generators
+# ==================================================================================================
+
+class TestIdGenerators:
+    """Tests for generate_completion_id() and generate_tool_call_id()."""
+    
+    def test_completion_id_format(self):
+        """
+        What it does: Verifies the completion ID is "chatcmpl-" plus 32 hex chars.
+        Purpose: Ensure the format matches the previous uuid4().hex based IDs.
+        """
+        completion_id = generate_completion_id()
+        
+        print(f"Generated: {completion_id}")
+        assert re.fullmatch(r"chatcmpl-[0-9a-f]{32}", completion_id)
+    
+    def test_tool_call_id_format(self):
+        """
+        What it does: Verifies the tool call ID is "call_" plus 8 hex chars.
+        Purpose: Ensure the format matches the previous uuid4().hex[:8] based IDs.
+        """
+        tool_call_id = generate_tool_call_id()
+        
+        print(f"Generated: {tool_call_id}")
+        assert re.fullmatch(r"call_[0-9a-f]{8}", tool_call_id)
+    
+    def test_completion_ids_are_unique(self):
+        """
+        What it does: Generates many completion IDs and checks for collisions.
+        Purpose: Ensure IDs stay random.
+        """
+        ids = {generate_completion_id() for _ in range(1000)}
+        
+        print(f"Unique IDs: {len(ids)}")
+        assert len(ids) == 1000
+
+
+# ==================================================================================================
+# Tests for generate_conversation_id
+# ==================================================================================================
+
+class TestGenerateConversationId:
+    """Tests for generate_conversation_id()."""
+    
+    def test_same_messages_give_same_id(self):
+        """
+        What it does: Verifies the ID is a stable 16-char hex string for the same history.
+        Purpose: Ensure the same key messages always produce the same ID.
+        """
+        messages = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": [{"type": "text", "text": "Hi there!"}]},
+        ]
+        
+        print("Action: Generating ID twice...")
+        first = generate_conversation_id(messages)
+        second = generate_conversation_id([dict(m) for m in messages])
+        
+        print(f"IDs: {first}, {second}")
+        assert re.fullmatch(r"[0-9a-f]{16}", first)
+        assert first == second
+    
+    def test_id_is_truncated_sha256_of_key_messages(self):
+        """
+        What it does: Pins the ID for a known history to its SHA-256-based value.
+        Purpose: Ensure the ID format and value stay unchanged for existing callers.
+        """
+        messages = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": [{"type": "text", "text": "Hi there!"}]},
+        ]
+        
+        print("Action: Generating ID for a known history...")
+        result = generate_conversation_id(messages)
+        
+        print(f"ID: {result}")
+        assert result == "2b706938009e6e07"
+    
+    def test_different_messages_give_different_ids(self):
+        """
+        What it does: Verifies different histories produce different IDs.
+        Purpose: Ensure unrelated conversations are not confused.
+        """
+        print("Action: Generating IDs for two histories...")
+        first = generate_conversation_id([{"role": "user", "content": "Hello"}])
+        second = generate_conversation_id([{"role": "user", "content": "Goodbye"}])
+        
+        print(f"IDs: {first}, {second}")
+        assert first != second
+    
+    def test_field_boundaries_are_kept(self):
+        """
+        What it does: Verifies shifting characters between role and content changes the ID.
+        Purpose: Ensure role and content are hashed as separate fields.
+        """
+        print("Action: Generating IDs for shifted role/content...")
+        first = generate_conversation_id([{"role": "user", "content": "ab"}])
+        second = generate_conversation_id([{"role": "usera", "content": "b"}])
+        
+        print(f"IDs: {first}, {second}")
+        assert first != second
+    
+    def test_only_first_three_and_last_messages_matter(self):
+        """
+        What it does: Verifies middle messages do not affect the ID.
+        Purpose: Ensure the ID stays stable as a conversation grows in the middle.
+        """
+        head = [{"role": "user", "content": f"m{i}"} for i in range(3)]
+        tail = {"role": "user", "content": "last"}
+        
+        print("Action: Generating IDs with different middle messages...")
+        first = generate_conversation_id(head + [{"role": "assistant", "content": "a"}, tail])
+        second = generate_conversation_id(head + [{"role": "assistant", "content": "b"}, tail])
+        
+        print(f"IDs: {first}, {second}")
+        assert first == second
+    
+    def test_no_messages_falls_back_to_uuid(self):
+        """
+        What it does: Verifies an empty history returns a random UUID.
+        Purpose: Ensure the backward-compatible fallback is kept.
+        """
+        print("Action: Generating IDs without messages...")
+        first = generate_conversation_id()
+        second = generate_conversation_id([])
+        
+        print(f"IDs: {first}, {second}")
+        assert re.fullmatch(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[0-9a-f]{4}-[0-9a-f]{12}", first)
+        assert first != second